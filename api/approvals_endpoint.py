@@ -181,12 +181,16 @@ async def broadcast_new_pending_tool(tool_data: dict, websocket_clients):
 def sync_broadcast_pending_tool(tool_data: dict):
     """Bridge function to call async broadcast from sync tool_queue."""
     # Import here to avoid circular dependency
-    from api.server import websocket_clients
+    from api import server
+    websocket_clients = server.websocket_clients
     
     try:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
+            # Agent runs happen on worker threads; use the server's loop
+            loop = server.event_loop
+        if loop is None:
             print("⚠️ No running event loop for WebSocket broadcast")
             return
         
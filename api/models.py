@@ -89,3 +89,21 @@ class InputResponseRequest(BaseModel):
     """Request model for submitting input response."""
     request_id: str
     response: str
+
+
+class TaskSubmitResponse(BaseModel):
+    """Response model for submitting a background agent task."""
+    task_id: str
+    status: str
+
+
+class TaskStatusResponse(BaseModel):
+    """Response model for polling a background agent task."""
+    task_id: str
+    status: str
+    response: Optional[str] = None
+    agent_thought: Optional[str] = None
+    tool_calls: int = 0
+    error: Optional[str] = None
+    created_at: str
+    completed_at: Optional[str] = None
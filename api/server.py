@@ -17,11 +17,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from api.models import (
     ChatRequest, ChatResponse, ToolCall, ToolInfo, ToolsResponse,
     MemoryResponse, MemoryEntry, SessionsResponse, SessionInfo, StatusResponse,
-    InputRequestInfo, InputRequestsResponse, InputResponseRequest
+    InputRequestInfo, InputRequestsResponse, InputResponseRequest,
+    TaskSubmitResponse, TaskStatusResponse
 )
 from core.agent import SeekerAgent
 from core.input_manager import input_manager
 from core.tool_queue import tool_queue
+from core.agent_tasks import agent_task_queue, agent_lock
 from config.settings import Settings
 
 
@@ -60,27 +62,41 @@ tool_queue.on_new_pending = sync_broadcast_pending_tool
 
 # Global agent instance
 agent: SeekerAgent = None
+_agent_create_lock = _threading.Lock()
+
+# Server event loop, so sync callbacks on worker threads can reach WebSockets
+event_loop: asyncio.AbstractEventLoop = None
 
 
 def get_or_create_agent(session_id: str = None) -> SeekerAgent:
     """Get existing agent or create new one."""
     global agent, active_sessions
     
-    if session_id and session_id in active_sessions:
-        return active_sessions[session_id]
-    
-    if agent is None:
-        agent = SeekerAgent()
-    
-    if session_id:
-        active_sessions[session_id] = agent
-    
-    return agent
+    # Called from request handlers and the task worker thread
+    with _agent_create_lock:
+        if session_id and session_id in active_sessions:
+            return active_sessions[session_id]
+        
+        if agent is None:
+            agent = SeekerAgent()
+        
+        if session_id:
+            active_sessions[session_id] = agent
+        
+        return agent
+
+
+def process_task_locked(current_agent: SeekerAgent, message: str) -> Dict[str, Any]:
+    """Run process_task while holding the agent's lock (call off the event loop)."""
+    with agent_lock(current_agent):
+        return current_agent.process_task(message)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    global event_loop
+    event_loop = asyncio.get_running_loop()
     print("🚀 Starting Seeker Agent API Server...")
     print("🔍 Discovering tools...")
     
@@ -117,8 +133,8 @@ async def chat(request: ChatRequest):
         # Get or create agent for this session
         current_agent = get_or_create_agent(request.session_id)
         
-        # Process the task
-        result = current_agent.process_task(request.message)
+        # Process the task on a worker thread; the agent may be busy with a queued task
+        result = await asyncio.to_thread(process_task_locked, current_agent, request.message)
         
         # Extract tool calls
         tool_calls = []
@@ -159,6 +175,62 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/tasks", response_model=TaskSubmitResponse)
+async def submit_task(request: ChatRequest):
+    """
+    Queue a message for background processing.
+    
+    Unlike /api/chat, this returns immediately so long agent runs do not
+    hold the HTTP request open. Poll /api/tasks/{task_id} for the result.
+    
+    Args:
+        request: ChatRequest with message and optional session_id
+        
+    Returns:
+        TaskSubmitResponse with the task ID
+    """
+    task_id = agent_task_queue.submit(
+        request.message,
+        get_or_create_agent,
+        session_id=request.session_id
+    )
+    agent_task_queue.cleanup_old()
+    return TaskSubmitResponse(task_id=task_id, status="queued")
+
+
+@app.get("/api/tasks/{task_id}", response_model=TaskStatusResponse)
+async def get_task(task_id: str):
+    """
+    Get the status and, once finished, the result of a background task.
+    
+    Args:
+        task_id: ID returned by POST /api/tasks
+        
+    Returns:
+        TaskStatusResponse with status and agent response
+    """
+    task = agent_task_queue.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    
+    result = task.result or {}
+    response_text = None
+    resp = result.get('response')
+    if hasattr(resp, 'message') and hasattr(resp.message, 'content'):
+        response_text = resp.message.content or ""
+    
+    return TaskStatusResponse(
+        task_id=task.id,
+        status=task.status,
+        response=response_text,
+        agent_thought=result.get('agent_thought'),
+        tool_calls=len(result.get('tool_results', [])),
+        error=task.error,
+        created_at=datetime.fromtimestamp(task.timestamp).isoformat(),
+        completed_at=datetime.fromtimestamp(task.completed_at).isoformat() if task.completed_at else None
+    )
+
+
 @app.get("/api/tools", response_model=ToolsResponse)
 async def get_tools():
     """
@@ -447,6 +519,9 @@ def sync_broadcast_input(request_data: dict):
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
+            # Agent runs happen on worker threads; use the server's loop
+            loop = event_loop
+        if loop is None:
             print("⚠️ No running event loop for WebSocket broadcast")
             return
         
@@ -513,7 +588,9 @@ async def websocket_chat(websocket: WebSocket):
             })
             
             # Process task
-            result = current_agent.process_task(message_data.get('message', ''))
+            result = await asyncio.to_thread(
+                process_task_locked, current_agent, message_data.get('message', '')
+            )
             
             # Send response
             response_text = ""
@@ -22,6 +22,20 @@ class Settings:
         self.memory_limit = int(os.getenv("SEEKER_MEMORY_LIMIT", "10"))
         self.history_limit = int(os.getenv("SEEKER_HISTORY_LIMIT", "50"))
         
+        # Tool Configuration
+        # When enabled, deferred tools (e.g. MCP) are summarized in the prompt
+        # and their schemas are loaded on demand via 'discover_tool'
+        self.tool_discovery = os.getenv("SEEKER_TOOL_DISCOVERY", "false").lower() == "true"
+        # When enabled, MCP tools are built from config/.mcp_tools_cache.json
+        # and each server is only started when one of its tools is first used
+        self.mcp_lazy = os.getenv("SEEKER_MCP_LAZY", "false").lower() == "true"
+        
+        # Session Storage ("file" or "redis")
+        self.session_backend = os.getenv("SEEKER_SESSION_BACKEND", "file").lower()
+        self.redis_url = os.getenv("SEEKER_REDIS_URL", "redis://localhost:6379/0")
+        self.redis_cluster = os.getenv("SEEKER_REDIS_CLUSTER", "false").lower() == "true"
+        self.session_ttl = int(os.getenv("SEEKER_SESSION_TTL", "86400"))
+        
         # API Keys
         self.ollama_api_key = os.getenv("OLLAMA_API_KEY")
         
@@ -12,7 +12,9 @@ from core.memory import MemoryManager
 from core.insight_loader import InsightLoader
 from core.session_logger import SessionLogger
 from core.conversation import ConversationHistory
+from core.session_store import create_session_store
 from plugins.registry import ToolRegistry
+from tools._async_writer import artifact_writer
 from config.settings import Settings
 
 
@@ -23,15 +25,18 @@ class SeekerAgent:
     Coordinates between LLM, tools, and memory to process user tasks.
     """
     
-    def __init__(self, config: Optional[Settings] = None):
+    def __init__(self, config: Optional[Settings] = None, session_store=None):
         """
         Initialize the Seeker agent.
         
         Args:
             config: Optional settings object. If None, uses default settings.
+            session_store: Optional session store (e.g. RedisSessionStore).
+                If None, one is created from config.session_backend.
         """
         # Load configuration
         self.config = config or Settings()
+        self.session_store = session_store or create_session_store(self.config)
         
         # Initialize components
         self.llm_client = LLMClient(
@@ -45,7 +50,10 @@ class SeekerAgent:
             history_limit=self.config.history_limit
         )
         
-        self.tool_registry = ToolRegistry()
+        self.tool_registry = ToolRegistry(
+            tool_discovery=self.config.tool_discovery,
+            mcp_lazy=self.config.mcp_lazy
+        )
         
         # Auto-discover and register tools
         print("🔍 Discovering tools...")
@@ -131,28 +139,40 @@ class SeekerAgent:
             if tool_calls:
                 print(f"\n🔧 Executing {len(tool_calls)} tool(s)...")
                 
-                for tool_call in tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = tool_call.function.arguments or {}
-                    
+                calls = [(tc.function.name, tc.function.arguments or {}) for tc in tool_calls]
+                
+                # Independent network calls (fetch/search) overlap their waits;
+                # anything with side effects keeps the LLM's sequential order
+                prefetched = None
+                if len(calls) > 1 and all(self.tool_registry.is_parallel_safe(name) for name, _ in calls):
+                    print(f"   ⚡ Running {len(calls)} calls concurrently")
+                    prefetched = self.tool_registry.execute_batch(calls)
+                
+                for i, (tool_name, tool_args) in enumerate(calls):
                     print(f"\n   → {tool_name}({', '.join([f'{k}={v}' for k, v in tool_args.items()])})")
                     
                     # Execute tool
-                    result = self.tool_registry.execute_tool(tool_name, **tool_args)
+                    if prefetched is not None:
+                        result = prefetched[i]
+                    else:
+                        result = self.tool_registry.execute_tool(tool_name, **tool_args)
                     results.append(result)
                     
+                    # Render list/dict results (e.g. search hits) once, not per consumer
+                    result_text = result if isinstance(result, str) else str(result)
+                    
                     # Add to conversation turn
-                    self.conversation.add_tool_call(tool_name, tool_args, result)
+                    self.conversation.add_tool_call(tool_name, tool_args, result_text)
                     
                     # Store tool execution in memory (with full result - 2000 chars)
                     self.memory.add_memory({
                         'type': 'tool_execution',
                         'tool_name': tool_name,
                         'args': tool_args,
-                        'result': str(result)[:2000]  # Increased from 500 to 2000 chars
+                        'result': result_text[:2000]  # Increased from 500 to 2000 chars
                     })
                     
-                    print(f"   ✓ Result: {str(result)[:200]}...")
+                    print(f"   ✓ Result: {result_text[:200]}...")
                     
                     # Track for session log (include result!)
                     tool_calls_data.append({
@@ -228,8 +248,11 @@ class SeekerAgent:
         tool_list_lines = []
         native_tools = []
         mcp_tools = []
+        deferred_summaries = self.tool_registry.get_deferred_summaries()
         for name in sorted(self.tool_registry.get_tool_names()):
             tool = self.tool_registry.get_tool(name)
+            if self.tool_registry.is_deferred(name):
+                continue
             if name.startswith('mcp_'):
                 mcp_tools.append((name, tool.description))
             else:
@@ -243,6 +266,9 @@ class SeekerAgent:
             tool_list_lines.append("[MCP Tools — external AI/service tools]")
             for name, desc in mcp_tools:
                 tool_list_lines.append(f"  • {name}: {desc}")
+        if deferred_summaries:
+            tool_list_lines.append("[Deferred Tools — call discover_tool to load their schemas before use]")
+            tool_list_lines.append(deferred_summaries)
         available_tools_text = "\n".join(tool_list_lines)
         
         prompt = f"""=== SYSTEM INSTRUCTIONS ===
@@ -406,16 +432,39 @@ Your response:
         
         # Close session on exit
         self.session_logger.close_session()
+        
+        # Make sure queued save_insight writes reach disk
+        artifact_writer.flush()
     
     def save_session(self, filepath: Optional[str] = None):
-        """Save current session to file."""
+        """
+        Save current session.
+        
+        With a session store configured, `filepath` is used as the session
+        key (defaults to the current session ID); otherwise it is a JSON file.
+        """
+        if self.session_store is not None:
+            key = filepath or self.session_logger.session_id
+            self.session_store.save(key, self.memory.to_dict())
+            print(f"💾 Session saved to {self.config.session_backend} ({key})")
+            return
+        
         if filepath is None:
             filepath = self.config.logs_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         self.memory.save_to_file(str(filepath))
         print(f"💾 Session saved to {filepath}")
     
     def load_session(self, filepath: str):
-        """Load session from file."""
+        """Load session from the session store or a JSON file."""
+        if self.session_store is not None:
+            data = self.session_store.load(filepath)
+            if data is None:
+                print(f"Session not found: {filepath}")
+                return
+            self.memory.load_from_dict(data)
+            print(f"📂 Session loaded from {self.config.session_backend} ({filepath})")
+            return
+        
         self.memory.load_from_file(filepath)
         print(f"📂 Session loaded from {filepath}")
     
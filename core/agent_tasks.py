@@ -0,0 +1,133 @@
+"""Background queue for long-running agent tasks submitted over HTTP."""
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+# One lock per agent so the task worker, /api/chat and /ws/chat never run
+# process_task on the same agent at once (agents are not thread-safe)
+_agent_locks: Dict[int, threading.Lock] = {}
+_agent_locks_guard = threading.Lock()
+
+
+def agent_lock(agent: Any) -> threading.Lock:
+    """Return the lock that serializes process_task calls on an agent."""
+    with _agent_locks_guard:
+        lock = _agent_locks.get(id(agent))
+        if lock is None:
+            lock = _agent_locks[id(agent)] = threading.Lock()
+        return lock
+
+
+@dataclass
+class AgentTask:
+    """Represents an agent run submitted for background execution."""
+    id: str
+    prompt: str
+    session_id: Optional[str]
+    status: str  # queued, running, completed, error
+    timestamp: float
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    completed_at: Optional[float] = None
+
+
+class AgentTaskQueue:
+    """
+    Runs agent tasks on worker threads so HTTP requests return immediately.
+
+    Clients submit a prompt, receive a task ID, and poll for the result.
+    Runs on the same agent are serialized with agent_lock(), so extra
+    workers (SEEKER_TASK_WORKERS) only help when sessions use separate agents.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("SEEKER_TASK_WORKERS", "1"))
+        self.tasks: Dict[str, AgentTask] = {}
+        self.lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="seeker-task"
+        )
+
+    def submit(self, prompt: str, get_agent: Callable[[Optional[str]], Any],
+               session_id: Optional[str] = None) -> str:
+        """
+        Queue an agent run.
+
+        Args:
+            prompt: Task for the agent
+            get_agent: Returns the agent for a session ID (called on the worker)
+            session_id: Optional session ID
+
+        Returns:
+            Unique task ID
+        """
+        task_id = str(uuid.uuid4())
+        task = AgentTask(
+            id=task_id,
+            prompt=prompt,
+            session_id=session_id,
+            status='queued',
+            timestamp=time.time()
+        )
+
+        with self.lock:
+            self.tasks[task_id] = task
+
+        self._executor.submit(self._run, task, get_agent)
+        print(f"📋 Queued agent task (ID: {task_id[:8]}...)")
+        return task_id
+
+    def _run(self, task: AgentTask, get_agent: Callable[[Optional[str]], Any]):
+        """Execute a queued task on a worker thread."""
+        with self.lock:
+            task.status = 'running'
+
+        try:
+            agent = get_agent(task.session_id)
+            with agent_lock(agent):
+                result = agent.process_task(task.prompt)
+            with self.lock:
+                task.result = result
+                task.error = result.get('error')
+                task.status = 'error' if task.error else 'completed'
+        except Exception as e:
+            with self.lock:
+                task.error = str(e)
+                task.status = 'error'
+        finally:
+            with self.lock:
+                task.completed_at = time.time()
+
+        print(f"✅ Agent task {task.status} (ID: {task.id[:8]}...)")
+
+    def get_task(self, task_id: str) -> Optional[AgentTask]:
+        """Get a specific task by ID."""
+        with self.lock:
+            return self.tasks.get(task_id)
+
+    def cleanup_old(self, max_age_seconds: int = 3600):
+        """Remove tasks that finished more than max_age_seconds ago."""
+        current_time = time.time()
+        with self.lock:
+            to_remove = [
+                task_id for task_id, task in self.tasks.items()
+                if task.status in ['completed', 'error']
+                and current_time - (task.completed_at or task.timestamp) > max_age_seconds
+            ]
+            for task_id in to_remove:
+                del self.tasks[task_id]
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting tasks and optionally wait for running ones."""
+        self._executor.shutdown(wait=wait)
+
+
+# Global queue instance
+agent_task_queue = AgentTaskQueue()
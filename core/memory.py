@@ -118,25 +118,32 @@ class MemoryManager:
         
         return "\n".join(context_parts) if context_parts else "No previous context"
     
-    def save_to_file(self, filepath: str):
-        """Save memory and history to a JSON file."""
-        data = {
+    def to_dict(self) -> Dict[str, Any]:
+        """Get memory, history and summaries as a serializable dict."""
+        return {
             'memory': self.memory,
             'history': self.history,
             'summaries': self.summaries,
             'saved_at': datetime.now().isoformat()
         }
+    
+    def load_from_dict(self, data: Dict[str, Any]):
+        """Restore memory, history and summaries from a dict."""
+        self.memory = data.get('memory', [])
+        self.history = data.get('history', [])
+        self.summaries = data.get('summaries', [])
+    
+    def save_to_file(self, filepath: str):
+        """Save memory and history to a JSON file."""
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            json.dump(self.to_dict(), f, indent=2, default=str)
     
     def load_from_file(self, filepath: str):
         """Load memory and history from a JSON file."""
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
-            self.memory = data.get('memory', [])
-            self.history = data.get('history', [])
-            self.summaries = data.get('summaries', [])
+            self.load_from_dict(data)
         except FileNotFoundError:
             print(f"Memory file not found: {filepath}")
         except Exception as e:
@@ -0,0 +1,74 @@
+"""Session storage backends for Seeker agent."""
+import json
+from typing import Any, Dict, Optional
+
+
+class RedisSessionStore:
+    """
+    Stores agent session state in Redis.
+
+    Keeps sessions off the local disk and lets several server processes
+    share them. Entries expire after `ttl` seconds.
+    """
+
+    KEY_PREFIX = "seeker:session:"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", ttl: int = 86400,
+                 cluster: bool = False):
+        """
+        Initialize the store.
+
+        Args:
+            url: Redis connection URL
+            ttl: Expiry for saved sessions in seconds
+            cluster: Connect with RedisCluster for sharded deployments
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        import redis
+
+        if cluster:
+            from redis.cluster import RedisCluster
+            self._client = RedisCluster.from_url(url)
+        else:
+            self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def save(self, session_id: str, state: Dict[str, Any]):
+        """Save session state under the given ID."""
+        self._client.set(
+            self.KEY_PREFIX + session_id,
+            json.dumps(state, default=str),
+            ex=self.ttl
+        )
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load session state, or None if it does not exist or has expired."""
+        raw = self._client.get(self.KEY_PREFIX + session_id)
+        return json.loads(raw) if raw else None
+
+    def __repr__(self):
+        return f"RedisSessionStore(ttl={self.ttl})"
+
+
+def create_session_store(settings) -> Optional[RedisSessionStore]:
+    """
+    Build the session store selected by settings.session_backend.
+
+    Returns:
+        A RedisSessionStore for the 'redis' backend, or None to use the
+        default JSON file backend
+    """
+    if settings.session_backend != "redis":
+        return None
+
+    try:
+        return RedisSessionStore(
+            url=settings.redis_url,
+            ttl=settings.session_ttl,
+            cluster=settings.redis_cluster
+        )
+    except ImportError:
+        print("⚠️  redis package not installed (pip install redis). Falling back to file sessions.")
+        return None
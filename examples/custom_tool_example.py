@@ -12,6 +12,8 @@ from typing import List
 class CalculatorTool(BaseTool):
     """Example custom tool: Simple calculator."""
     
+    __slots__ = ()
+    
     name = "calculator"
     description = "Perform basic arithmetic operations (add, subtract, multiply, divide)"
     parameters = {
@@ -75,6 +77,10 @@ class TextAnalyzerTool(BaseTool):
         }
 
 
+# Directories the file counter never descends into (hidden ones are skipped too)
+IGNORED_DIRS = {"__pycache__", "node_modules", "venv", "env", "dist", "build"}
+
+
 class FileCounterTool(BaseTool):
     """Example custom tool: Count files by extension."""
     
@@ -96,7 +102,12 @@ class FileCounterTool(BaseTool):
             extension_counts = defaultdict(int)
             total_files = 0
             
-            for root, _, files in os.walk(directory):
+            for root, dirs, files in os.walk(directory):
+                # Prune in place so VCS/venv/node_modules trees are never entered
+                dirs[:] = [
+                    d for d in dirs
+                    if d not in IGNORED_DIRS and not d.startswith('.') and not d.endswith('.egg-info')
+                ]
                 for file in files:
                     total_files += 1
                     ext = Path(file).suffix or 'no_extension'
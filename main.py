@@ -19,7 +19,7 @@ def main():
     if env_file.exists():
         settings.load_from_env_file(str(env_file))
     
-    # Create and run agent
+    # Create and run agent (it picks the session backend from settings)
     agent = SeekerAgent(config=settings)
     agent.run_interactive()
 
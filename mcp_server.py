@@ -9,13 +9,33 @@ Author: Seeker AI
 """
 
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
 
 class MCPHandler(BaseHTTPRequestHandler):
     """Handle MCP protocol requests"""
     
+    # Keep connections open between requests
+    protocol_version = 'HTTP/1.1'
+    
+    def send_json(self, status, payload):
+        """Send status line, headers and JSON body in a single write"""
+        body = json.dumps(payload).encode()
+        # parse_request() sets close_connection from the request's Connection header
+        connection = "close" if self.close_connection else "keep-alive"
+        head = (
+            f"{self.protocol_version} {status} {self.responses[status][0]}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {connection}\r\n"
+            "\r\n"
+        ).encode('latin-1')
+        self.log_request(status)
+        self.wfile.write(head + body)
+    
     def do_GET(self):
         """Handle GET requests for context information"""
         parsed_path = urlparse(self.path)
@@ -52,10 +72,7 @@ class MCPHandler(BaseHTTPRequestHandler):
             }
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(context).encode())
+        self.send_json(200, context)
     
     def handle_tools_request(self):
         """List available tools and their capabilities"""
@@ -74,10 +91,7 @@ class MCPHandler(BaseHTTPRequestHandler):
             }
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(tools).encode())
+        self.send_json(200, tools)
     
     def handle_action_request(self):
         """Process requested actions"""
@@ -92,16 +106,10 @@ class MCPHandler(BaseHTTPRequestHandler):
             # Process the action based on type
             result = self.process_action(action_type, action_params)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.send_json(200, result)
         except Exception as e:
             error_response = {"error": str(e)}
-            self.send_response(400)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode())
+            self.send_json(400, error_response)
     
     def process_action(self, action_type, params):
         """Process specific actions"""
@@ -118,7 +126,8 @@ class MCPHandler(BaseHTTPRequestHandler):
 def run_server(port=8000):
     """Run the MCP server"""
     server_address = ('localhost', port)
-    httpd = HTTPServer(server_address, MCPHandler)
+    # Threaded so one idle keep-alive connection cannot block other clients
+    httpd = ThreadingHTTPServer(server_address, MCPHandler)
     print(f"MCP Server running on http://localhost:{port}")
     httpd.serve_forever()
 
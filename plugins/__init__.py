@@ -1,4 +1,5 @@
 """Plugin system for Seeker agent."""
 from .registry import ToolRegistry
+from .discovery import ToolDiscoveryTool
 
-__all__ = ['ToolRegistry']
+__all__ = ['ToolRegistry', 'ToolDiscoveryTool']
@@ -0,0 +1,110 @@
+"""Tool discovery for progressive schema disclosure."""
+import json
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from tools.base import BaseTool
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens (snake_case names are split on '_')."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _bm25_rank(query: str, documents: List[Tuple[str, str]],
+               k1: float = 1.5, b: float = 0.75) -> List[Tuple[str, float]]:
+    """
+    Rank (key, text) documents against a query with Okapi BM25.
+
+    Args:
+        query: Free-text query
+        documents: List of (key, text) pairs
+        k1: Term-frequency saturation
+        b: Length normalization
+
+    Returns:
+        (key, score) pairs with a positive score, best first
+    """
+    query_terms = _tokenize(query)
+    if not query_terms or not documents:
+        return []
+
+    tokenized = [(key, _tokenize(text)) for key, text in documents]
+    n_docs = len(tokenized)
+    avg_len = sum(len(toks) for _, toks in tokenized) / n_docs or 1.0
+
+    doc_freq: Counter = Counter()
+    for _, toks in tokenized:
+        doc_freq.update(set(toks))
+
+    scores = []
+    for key, toks in tokenized:
+        tf = Counter(toks)
+        norm = k1 * (1 - b + b * len(toks) / avg_len)
+        score = 0.0
+        for term in query_terms:
+            freq = tf.get(term)
+            if not freq:
+                continue
+            idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            score += idf * freq * (k1 + 1) / (freq + norm)
+        if score > 0:
+            scores.append((key, score))
+
+    scores.sort(key=lambda item: item[1], reverse=True)
+    return scores
+
+
+class ToolDiscoveryTool(BaseTool, register=False):
+    """Returns full schemas of deferred tools on demand."""
+
+    __slots__ = ('_registry',)
+
+    name = "discover_tool"
+    description = (
+        "Find tools that are only listed by summary and load their full schemas. "
+        "Pass an exact tool name or keywords describing what you need."
+    )
+    parameters = {
+        "query": {
+            "type": "string",
+            "description": "Exact tool name or keywords describing the capability"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of tool schemas to return (default: 3)"
+        }
+    }
+
+    def __init__(self, registry):
+        self._registry = registry
+        super().__init__()
+
+    def execute(self, query: str, max_results: int = 3) -> str:
+        """Search deferred tools and return their schemas as JSON."""
+        deferred = {
+            name: tool for name, tool in self._registry.get_all_tools().items()
+            if getattr(tool, 'defer', False)
+        }
+        if not deferred:
+            return "No deferred tools are registered."
+
+        if query in deferred:
+            matches = [query]
+        else:
+            documents = [
+                (name, f"{name} {tool.description} {getattr(tool, 'search_hint', '')}")
+                for name, tool in deferred.items()
+            ]
+            matches = [name for name, _ in _bm25_rank(query, documents)[:max_results]]
+
+        if not matches:
+            return f"No tools matched '{query}'."
+
+        self._registry.mark_discovered(matches)
+        schemas: List[Dict[str, Any]] = [deferred[name].get_schema() for name in matches]
+        return json.dumps(schemas, indent=2)
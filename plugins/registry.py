@@ -1,10 +1,14 @@
 """Tool registry for automatic tool discovery and registration."""
-from typing import Dict, List, Type, Any
-import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Set, Tuple, Type
+import asyncio
 import importlib
 import pkgutil
 from pathlib import Path
 
+# Upper bound on concurrently running tool calls in execute_batch(_async)
+_MAX_BATCH_CONCURRENCY = 32
+
 
 class ToolRegistry:
     """
@@ -13,9 +17,33 @@ class ToolRegistry:
     Automatically discovers and registers tools that inherit from BaseTool.
     """
     
-    def __init__(self):
+    __slots__ = ('_tools', '_tool_classes', '_schemas', '_dispatchers',
+                 '_discovered', 'tool_discovery', 'mcp_lazy')
+    
+    def __init__(self, tool_discovery: bool = False, mcp_lazy: bool = False):
+        """
+        Initialize the registry.
+        
+        Args:
+            tool_discovery: If True, deferred tools are only summarized to the
+                LLM and a 'discover_tool' tool is registered to load their
+                full schemas on demand
+            mcp_lazy: If True, MCP tools are built from the cached tool list
+                and servers start on first use (see tools.mcp_tools)
+        """
         self._tools: Dict[str, Any] = {}
         self._tool_classes: Dict[str, Type] = {}
+        # Schemas are built once at registration instead of every LLM turn
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        # Per-tool closures bound at registration (see _make_dispatcher)
+        self._dispatchers: Dict[str, Callable[..., Any]] = {}
+        self._discovered: Set[str] = set()
+        self.tool_discovery = tool_discovery
+        self.mcp_lazy = mcp_lazy
+        
+        if tool_discovery:
+            from plugins.discovery import ToolDiscoveryTool
+            self.register_tool(ToolDiscoveryTool(self))
     
     def register_tool(self, tool_instance):
         """
@@ -33,12 +61,19 @@ class ToolRegistry:
         
         self._tools[tool_name] = tool_instance
         self._tool_classes[tool_name] = tool_instance.__class__
+        self._dispatchers[tool_name] = _make_dispatcher(tool_name, tool_instance.execute)
+        
+        if hasattr(tool_instance, 'get_schema'):
+            self._schemas[tool_name] = tool_instance.get_schema()
         
     def unregister_tool(self, tool_name: str):
         """Remove a tool from the registry."""
         if tool_name in self._tools:
             del self._tools[tool_name]
             del self._tool_classes[tool_name]
+            self._schemas.pop(tool_name, None)
+            self._dispatchers.pop(tool_name, None)
+            self._discovered.discard(tool_name)
     
     def get_tool(self, tool_name: str):
         """Get a tool instance by name."""
@@ -53,12 +88,38 @@ class ToolRegistry:
         return list(self._tools.keys())
     
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
-        """Get schemas for all tools (for LLM function calling)."""
-        schemas = []
-        for tool in self._tools.values():
-            if hasattr(tool, 'get_schema'):
-                schemas.append(tool.get_schema())
-        return schemas
+        """
+        Get schemas for all tools (for LLM function calling).
+        
+        With tool discovery enabled, deferred tools are left out until they
+        have been returned by 'discover_tool'.
+        """
+        return [
+            schema for name, schema in self._schemas.items()
+            if not self.is_deferred(name)
+        ]
+    
+    def get_deferred_summaries(self) -> str:
+        """One line per deferred tool that has not been discovered yet."""
+        return "\n".join(
+            f"- {name}: {tool.description.split('.')[0]}"
+            for name, tool in self._tools.items()
+            if self.is_deferred(name)
+        )
+    
+    def mark_discovered(self, tool_names: List[str]):
+        """Include the given deferred tools' full schemas from now on."""
+        self._discovered.update(n for n in tool_names if n in self._tools)
+    
+    def is_deferred(self, tool_name: str) -> bool:
+        """Whether a tool's full schema is currently withheld from the LLM."""
+        return (self.tool_discovery
+                and getattr(self._tools.get(tool_name), 'defer', False)
+                and tool_name not in self._discovered)
+    
+    def is_parallel_safe(self, tool_name: str) -> bool:
+        """Whether calls to a tool may run concurrently with each other."""
+        return getattr(self._tools.get(tool_name), 'parallel_safe', False)
     
     def auto_discover_tools(self, tools_package_path: str = None):
         """
@@ -72,41 +133,37 @@ class ToolRegistry:
             current_file = Path(__file__)
             tools_package_path = current_file.parent.parent / "tools"
         
-        # Import the tools package
+        # Import every tool module; BaseTool subclasses record themselves
+        # in BaseTool._SUBCLASSES as their class bodies execute
         try:
             import tools
             from tools.base import BaseTool
-            
-            # Iterate through all modules in the tools package
-            for importer, modname, ispkg in pkgutil.iter_modules(tools.__path__):
-                if modname == 'base' or modname.startswith('_'):
-                    continue
-                
-                # Import the module
-                module = importlib.import_module(f'tools.{modname}')
-                
-                # Find all classes that inherit from BaseTool
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (issubclass(obj, BaseTool) and 
-                        obj is not BaseTool and 
-                        hasattr(obj, 'name') and 
-                        obj.name):
-                        try:
-                            # Instantiate and register the tool
-                            tool_instance = obj()
-                            self.register_tool(tool_instance)
-                            print(f"✓ Registered tool: {tool_instance.name}")
-                        except Exception as e:
-                            print(f"✗ Failed to register {name}: {e}")
-        
         except ImportError as e:
             print(f"Warning: Could not import tools package: {e}")
+            return
+        
+        for importer, modname, ispkg in pkgutil.iter_modules(tools.__path__):
+            if modname == 'base' or modname.startswith('_'):
+                continue
+            try:
+                importlib.import_module(f'tools.{modname}')
+            except ImportError as e:
+                print(f"✗ Failed to import tools.{modname}: {e}")
+        
+        for cls in BaseTool._SUBCLASSES:
+            try:
+                # Instantiate and register the tool
+                tool_instance = cls()
+                self.register_tool(tool_instance)
+                print(f"✓ Registered tool: {tool_instance.name}")
+            except Exception as e:
+                print(f"✗ Failed to register {cls.__name__}: {e}")
         
         # ── MCP server tools ────────────────────────────────────────────────
         try:
             from tools.mcp_tools import discover_mcp_tools
             print("\n🔌 Discovering MCP server tools...")
-            mcp_tools = discover_mcp_tools()
+            mcp_tools = discover_mcp_tools(lazy=self.mcp_lazy)
             for tool in mcp_tools:
                 self.register_tool(tool)
             if mcp_tools:
@@ -127,14 +184,113 @@ class ToolRegistry:
         Returns:
             Tool execution result
         """
-        tool = self.get_tool(tool_name)
-        if tool is None:
+        dispatch = self._dispatchers.get(tool_name)
+        if dispatch is None:
             return f"Error: Tool '{tool_name}' not found"
+        return dispatch(**kwargs)
+    
+    def execute_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Execute several independent tool calls.
+        
+        Calls to the same tool are handed to that tool's own execute_batch
+        when it overrides BaseTool.execute_batch; all other calls run on a
+        thread pool.
+        
+        Args:
+            calls: List of (tool_name, kwargs) pairs
+            
+        Returns:
+            Results in the same order as calls
+        """
+        results: List[Any] = [None] * len(calls)
+        batched, single = self._group_calls(calls, results)
+        
+        for tool, indices in batched:
+            self._store_batch(tool, indices, results, self._run_tool_batch(tool, indices, calls))
         
+        if single:
+            workers = min(_MAX_BATCH_CONCURRENCY, len(single))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outputs = executor.map(
+                    lambda i: self.execute_tool(calls[i][0], **calls[i][1]), single
+                )
+                for i, output in zip(single, outputs):
+                    results[i] = output
+        
+        return results
+    
+    async def execute_batch_async(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Async variant of execute_batch.
+        
+        Tool calls run in worker threads via asyncio.to_thread, with at most
+        _MAX_BATCH_CONCURRENCY in flight at once.
+        """
+        results: List[Any] = [None] * len(calls)
+        batched, single = self._group_calls(calls, results)
+        semaphore = asyncio.Semaphore(_MAX_BATCH_CONCURRENCY)
+        
+        async def run_batch(tool, indices):
+            async with semaphore:
+                outputs = await asyncio.to_thread(self._run_tool_batch, tool, indices, calls)
+            self._store_batch(tool, indices, results, outputs)
+        
+        async def run_single(i):
+            async with semaphore:
+                results[i] = await asyncio.to_thread(
+                    lambda: self.execute_tool(calls[i][0], **calls[i][1])
+                )
+        
+        await asyncio.gather(
+            *(run_batch(tool, indices) for tool, indices in batched),
+            *(run_single(i) for i in single)
+        )
+        return results
+    
+    def _group_calls(self, calls, results):
+        """
+        Split calls into per-tool batches and individual calls.
+        
+        Unknown tools get their error result filled in immediately.
+        
+        Returns:
+            ([(tool, indices), ...] for tools with their own execute_batch,
+             [index, ...] for calls to run individually)
+        """
+        from tools.base import BaseTool
+        
+        groups: Dict[str, List[int]] = {}
+        for i, (tool_name, _) in enumerate(calls):
+            groups.setdefault(tool_name, []).append(i)
+        
+        batched = []
+        single = []
+        for tool_name, indices in groups.items():
+            tool = self._tools.get(tool_name)
+            if tool is None:
+                for i in indices:
+                    results[i] = f"Error: Tool '{tool_name}' not found"
+            elif type(tool).execute_batch is not BaseTool.execute_batch and len(indices) > 1:
+                batched.append((tool, indices))
+            else:
+                single.extend(indices)
+        return batched, single
+    
+    def _run_tool_batch(self, tool, indices, calls) -> List[Any]:
+        """Call a tool's execute_batch, turning a failure into per-call errors."""
         try:
-            return tool.execute(**kwargs)
+            return tool.execute_batch([calls[i][1] for i in indices])
         except Exception as e:
-            return f"Error executing tool '{tool_name}': {e}"
+            return [f"Error executing tool '{tool.name}': {e}"] * len(indices)
+    
+    def _store_batch(self, tool, indices, results, outputs):
+        """Write a tool batch's outputs back into their original positions."""
+        if len(outputs) != len(indices):
+            outputs = [f"Error executing tool '{tool.name}': batch returned "
+                       f"{len(outputs)} result(s) for {len(indices)} call(s)"] * len(indices)
+        for i, output in zip(indices, outputs):
+            results[i] = output
     
     def __repr__(self):
         return f"ToolRegistry(tools={len(self._tools)})"
@@ -144,6 +300,21 @@ class ToolRegistry:
         return f"ToolRegistry with {len(self._tools)} tools:\n{tools_list}"
 
 
+def _make_dispatcher(tool_name: str, execute: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind a tool's execute method into a closure once, at registration.
+    
+    execute_tool then does a single dict lookup and call, with no attribute
+    lookups on the tool instance per invocation.
+    """
+    def dispatch(**kwargs):
+        try:
+            return execute(**kwargs)
+        except Exception as e:
+            return f"Error executing tool '{tool_name}': {e}"
+    return dispatch
+
+
 # Global registry instance
 _global_registry = None
 
@@ -1,4 +1,11 @@
-"""Run the Seeker Agent web server."""
+"""
+Run the Seeker Agent web server.
+
+Long agent runs can be submitted with POST /api/tasks, which returns a
+task ID immediately; poll GET /api/tasks/{task_id} for the result. Tasks
+run on background threads (SEEKER_TASK_WORKERS, default 1) so the HTTP
+worker is never held for the length of an agent run.
+"""
 import sys
 from pathlib import Path
 
@@ -16,6 +23,7 @@ if __name__ == "__main__":
     print("📍 Web Interface: http://localhost:8000")
     print("📍 API Documentation: http://localhost:8000/docs")
     print("📍 Alternative API docs: http://localhost:8000/redoc")
+    print("📍 Background tasks: POST /api/tasks, GET /api/tasks/{task_id}")
     print()
     print("=" * 70)
     print()
@@ -0,0 +1,58 @@
+"""Regression tests for DuckDuckGo result parsing in web_search_improved."""
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import web_search_improved
+
+FIXTURE = Path(__file__).parent / "fixtures" / "ddg_results.html"
+
+EXPECTED = [
+    {
+        "title": "Python Packaging User Guide",
+        "url": "https://packaging.python.org/en/latest/",
+        "snippet": "ThePythonPackagingUser Guide is a collection of tutorials and guides.",
+    },
+    {
+        "title": "6. Modules — Python 3 documentation",
+        "url": "https://docs.python.org/3/tutorial/modules.html",
+        "snippet": "A module is a file containingPythondefinitions and statements.",
+    },
+    {
+        "title": "PyPI · The Python Package Index",
+        "url": "https://pypi.org/",
+        "snippet": "Find, install and publishPythonpackages.",
+    },
+]
+
+
+class ParseResultsTest(unittest.TestCase):
+    """Both parser backends must find DDG's multi-class result divs."""
+
+    def setUp(self):
+        self.html = FIXTURE.read_text(encoding="utf-8")
+        self._saved_parser = web_search_improved._HTML_PARSER
+
+    def tearDown(self):
+        web_search_improved._HTML_PARSER = self._saved_parser
+
+    def test_bs4_fallback(self):
+        try:
+            import bs4  # noqa: F401
+        except ImportError:
+            self.skipTest("beautifulsoup4 not installed")
+        web_search_improved._HTML_PARSER = None
+        self.assertEqual(web_search_improved._parse_results(self.html, 10), EXPECTED)
+
+    def test_selectolax(self):
+        web_search_improved._HTML_PARSER = web_search_improved._UNSET
+        if web_search_improved._import_html_parser() is None:
+            self.skipTest("selectolax not installed")
+        self.assertEqual(web_search_improved._parse_results(self.html, 10), EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,42 @@
-"""Tools package for Seeker agent."""
+"""Tools package for Seeker agent.
+
+Tool modules are imported lazily (PEP 562) so that touching one tool does
+not drag in requests, PyPDF2, ollama, etc. for all the others.
+"""
+import importlib
+
 from .base import BaseTool
-from .file_tools import *
-from .web_tools import *
-from .system_tools import *
-from .pdf_extractor import PDFExtractorTool
-from .ollama_tools import *
 
-__all__ = ['BaseTool']
\ No newline at end of file
+# Public name -> submodule that defines it
+_LAZY = {
+    'ReadFileTool': '.file_tools',
+    'ReadFileRangeTool': '.file_tools',
+    'WriteFileTool': '.file_tools',
+    'ListDirectoryTool': '.file_tools',
+    'list_directory': '.file_tools',
+    'WebFetchTool': '.web_tools',
+    'WebSearchTool': '.web_tools',
+    'ExecuteCommandTool': '.system_tools',
+    'GetTimeTool': '.system_tools',
+    'WaitForTaskTool': '.system_tools',
+    'PDFExtractorTool': '.pdf_extractor',
+    'OllamaChatTool': '.ollama_tools',
+    'OllamaListModelTool': '.ollama_tools',
+    'OllamaPullModelTool': '.ollama_tools',
+}
+
+__all__ = ['BaseTool'] + list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access and cache the attribute."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
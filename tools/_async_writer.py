@@ -0,0 +1,59 @@
+"""Background writer for non-critical text artifacts (insight files)."""
+import atexit
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class AsyncArtifactWriter:
+    """
+    Writes text files on a daemon thread so tools return without waiting on disk.
+
+    Pending writes are drained in batches of up to 32; flush() blocks until
+    everything submitted so far is on disk.
+    """
+
+    BATCH_SIZE = 32
+
+    def __init__(self):
+        self._q: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, path: Path, data: str):
+        """Queue data to be written to path as UTF-8."""
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._loop, name="seeker-artifact-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._q.put((path, data))
+
+    def flush(self):
+        """Block until all queued writes have completed."""
+        if self._thread is not None:
+            self._q.join()
+
+    def _loop(self):
+        while True:
+            batch = [self._q.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            for path, data in batch:
+                try:
+                    path.write_text(data, encoding="utf-8")
+                except Exception as e:
+                    print(f"❌ Error writing {path}: {e}")
+                finally:
+                    self._q.task_done()
+
+
+# Shared instance; flushed at interpreter exit since the thread is a daemon
+artifact_writer = AsyncArtifactWriter()
+atexit.register(artifact_writer.flush)
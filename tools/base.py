@@ -1,6 +1,6 @@
 """Base tool class for all Seeker tools."""
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import inspect
 
 
@@ -10,12 +10,36 @@ class BaseTool(ABC):
     
     All tools must inherit from this class and implement the execute method.
     Tools are automatically registered when imported.
+    
+    Subclasses that need constructor arguments (and so cannot be
+    auto-instantiated) opt out with ``class MyTool(BaseTool, register=False)``.
     """
     
+    # No per-instance __dict__; subclasses that add no state use __slots__ = ()
+    __slots__ = ('_schema_cache',)
+    
+    # Every named subclass, appended at class-definition time
+    _SUBCLASSES: List[type] = []
+    
     # Tool metadata (must be overridden in subclasses)
     name: str = ""
     description: str = ""
     parameters: Dict[str, Any] = {}
+
+    # Progressive disclosure: deferred tools are advertised to the LLM by a
+    # one-line summary only and their full schema is loaded via discover_tool
+    defer: bool = False
+    search_hint: str = ""
+
+    # Side-effect-free, I/O-bound tools (web fetch/search) set this so the
+    # agent may run several of their calls from one response concurrently
+    parallel_safe: bool = False
+
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        """Record concrete tool classes for ToolRegistry.auto_discover_tools."""
+        super().__init_subclass__(**kwargs)
+        if register and cls.name:
+            BaseTool._SUBCLASSES.append(cls)
     
     def __init__(self):
         """Initialize the tool."""
@@ -23,6 +47,7 @@ class BaseTool(ABC):
             raise ValueError(f"{self.__class__.__name__} must define a 'name' attribute")
         if not self.description:
             raise ValueError(f"{self.__class__.__name__} must define a 'description' attribute")
+        self._schema_cache: Optional[Dict[str, Any]] = None
     
     @abstractmethod
     def execute(self, **kwargs) -> Any:
@@ -37,6 +62,22 @@ class BaseTool(ABC):
         """
         pass
     
+    def execute_batch(self, batch: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Execute the tool once per parameter dict.
+        
+        Override when the tool can amortize setup (HTTP session, model load)
+        across calls; ToolRegistry.execute_batch uses the override for
+        same-tool groups and otherwise runs calls in parallel.
+        
+        Args:
+            batch: List of keyword-argument dicts, one per call
+            
+        Returns:
+            Results in the same order as batch
+        """
+        return [self.execute(**kwargs) for kwargs in batch]
+    
     def get_schema(self) -> Dict[str, Any]:
         """
         Get the tool schema for LLM function calling.
@@ -44,6 +85,9 @@ class BaseTool(ABC):
         Returns:
             Tool schema in OpenAI function calling format
         """
+        if self._schema_cache is not None:
+            return self._schema_cache
+        
         # Get execute method signature
         sig = inspect.signature(self.execute)
         parameters = {}
@@ -68,7 +112,7 @@ class BaseTool(ABC):
         if self.parameters:
             parameters.update(self.parameters)
         
-        return {
+        self._schema_cache = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -80,6 +124,7 @@ class BaseTool(ABC):
                 }
             }
         }
+        return self._schema_cache
     
     def _get_type_string(self, annotation) -> str:
         """Convert Python type annotation to JSON schema type."""
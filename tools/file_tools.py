@@ -1,21 +1,28 @@
 """File system tools for Seeker agent."""
+import codecs
+import io
+import mmap
 import os
-from typing import List, Optional, Set
+from itertools import islice
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 from .base import BaseTool
 
 # Directories that are almost never useful to the agent and inflate output significantly
-_DEFAULT_IGNORE_DIRS: Set[str] = {
+_DEFAULT_IGNORE_DIRS: FrozenSet[str] = frozenset({
     ".git", ".svn", ".hg",                        # VCS metadata
     "__pycache__", ".mypy_cache", ".pytest_cache", # Python artifacts
     ".venv", "venv", "env", ".env",                # Virtual envs
     "node_modules", ".next", "dist", "build",      # JS/TS artifacts
     ".idea", ".vscode",                             # IDE config
-    "*.egg-info", ".tox",                           # packaging
-}
+    ".tox",                                         # packaging
+})
+
+# Directory name suffixes to skip (e.g. mypkg.egg-info)
+_IGNORE_DIR_SUFFIXES = (".egg-info",)
 
 # File extensions to skip (binary / large generated files)
-_DEFAULT_IGNORE_EXTS: Set[str] = {
+_DEFAULT_IGNORE_EXTS: FrozenSet[str] = frozenset({
     ".pyc", ".pyo", ".pyd",
     ".so", ".dll", ".exe", ".bin",
     ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".ico", ".svg",
@@ -23,11 +30,29 @@ _DEFAULT_IGNORE_EXTS: Set[str] = {
     ".zip", ".tar", ".gz", ".rar",
     ".db", ".sqlite", ".sqlite3",
     ".lock",  # e.g. poetry.lock, package-lock.json are huge
-}
+})
 
 # Hard cap to prevent runaway output
 _MAX_ENTRIES = 500
 
+# Files larger than this are read through mmap instead of a buffered read
+_MMAP_THRESHOLD = 64 * 1024
+
+# Chunk size for the streaming fallback when a file cannot be mapped
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Write buffer size; large writes reach the OS in few, big chunks
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Content at least this large is encoded once and written with os.write,
+# skipping the text layer's chunked encode-and-copy
+_RAW_WRITE_THRESHOLD = 4 * 1024 * 1024
+
+# Parent directories WriteFileTool has already created or seen, so repeated
+# writes into one folder skip makedirs' per-ancestor stat calls
+_ENSURED_DIRS: Set[str] = set()
+_MAX_ENSURED_DIRS = 1024
+
 
 class ReadFileTool(BaseTool):
     """Tool for reading file contents."""
@@ -42,20 +67,80 @@ class ReadFileTool(BaseTool):
     }
 
     def execute(self, file_path: str) -> str:
-        """Read file with multiple encoding fallbacks."""
-        encodings = [("utf-8", None), ("utf-8", "replace"), ("latin-1", None)]
-        for enc, errors in encodings:
-            try:
-                kwargs = {"encoding": enc}
-                if errors:
-                    kwargs["errors"] = errors
-                with open(file_path, "r", **kwargs) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                return f"Error reading file {file_path}: {e}"
-        return f"Error reading file {file_path}: could not decode with any supported encoding"
+        """Read the file once, then decode as UTF-8 with a lossy fallback."""
+        try:
+            if os.path.getsize(file_path) > _MMAP_THRESHOLD:
+                try:
+                    return self._read_mapped(file_path)
+                except (OSError, ValueError):
+                    # Filesystem without mmap support (some FUSE/network
+                    # mounts) or the file shrank: stream it instead
+                    return self._read_chunked(file_path)
+            with open(file_path, "rb") as f:
+                return _decode_text(f.read())
+        except Exception as e:
+            return f"Error reading file {file_path}: {e}"
+
+    def _read_mapped(self, file_path: str) -> str:
+        """Decode a large file straight from a read-only memory map."""
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            # access= works on both POSIX and Windows (prot= is POSIX-only)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_text(mm)
+        finally:
+            os.close(fd)
+
+    def _read_chunked(self, file_path: str) -> str:
+        """Decode a large file in 1 MiB chunks; only one chunk is held as bytes."""
+        # Handles multi-byte characters and \r\n pairs split across chunks
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        parts: List[str] = []
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                chunk = f.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
+
+class ReadFileRangeTool(BaseTool):
+    """Tool for reading a range of lines from a file."""
+
+    name = "read_file_range"
+    description = "Read specific line ranges from a file (1-based, inclusive)"
+    parameters = {
+        "file_path": {
+            "type": "string",
+            "description": "Absolute or relative path to the file to read",
+        },
+        "start_line": {
+            "type": "integer",
+            "description": "First line to read (1-based)",
+        },
+        "end_line": {
+            "type": "integer",
+            "description": "Last line to read (inclusive)",
+        },
+    }
+
+    def execute(self, file_path: str, start_line: int, end_line: int) -> str:
+        """Read lines start_line..end_line, stopping at end_line."""
+        if start_line < 1 or end_line < start_line:
+            return f"Error: invalid line range {start_line}-{end_line}"
+        try:
+            # islice stops reading at end_line instead of loading the whole file
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                selected = list(islice(f, start_line - 1, end_line))
+        except Exception as e:
+            return f"Error reading file {file_path}: {e}"
+        if not selected:
+            return ""
+        return "".join(selected)
 
 
 class WriteFileTool(BaseTool):
@@ -77,9 +162,15 @@ class WriteFileTool(BaseTool):
     def execute(self, file_path: str, content: str) -> str:
         """Write content to file with directory creation."""
         try:
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            parent = os.path.dirname(os.path.abspath(file_path))
+            _ensure_dir(parent)
+            try:
+                _write_text(file_path, content)
+            except FileNotFoundError:
+                # Cached directory was removed since; recreate it once
+                _ENSURED_DIRS.discard(parent)
+                _ensure_dir(parent)
+                _write_text(file_path, content)
             return f"Successfully wrote to {file_path}"
         except Exception as e:
             return f"Error writing to file {file_path}: {e}"
@@ -124,89 +215,174 @@ class ListDirectoryTool(BaseTool):
             return f"'{directory}' is not a directory."
 
         lines: List[str] = [f"📁 {directory}  (depth={depth})"]
-        counter = [0]  # mutable so nested fn can modify it
-
-        self._walk(path, lines, 0, depth, show_hidden, counter)
+        count = 0
+        # The walk is lazy, so stopping at the cap skips all remaining scans
+        for line, is_entry in self._iter_walk(path, depth, show_hidden):
+            if count >= _MAX_ENTRIES:
+                break
+            lines.append(line)
+            count += is_entry
 
-        if counter[0] >= _MAX_ENTRIES:
+        if count >= _MAX_ENTRIES:
             lines.append(
                 f"\n⚠️  Output truncated at {_MAX_ENTRIES} entries. "
                 "Use a smaller depth or navigate to a subdirectory."
             )
 
-        lines.append(f"\n{counter[0]} item(s) listed.")
+        lines.append(f"\n{count} item(s) listed.")
         return "\n".join(lines)
 
     # ------------------------------------------------------------------
-    def _is_ignored_dir(self, name: str, show_hidden: bool) -> bool:
-        if not show_hidden and name.startswith("."):
-            return True
-        return name in _DEFAULT_IGNORE_DIRS
-
-    def _is_ignored_file(self, name: str, show_hidden: bool) -> bool:
-        if not show_hidden and name.startswith("."):
-            return True
-        return Path(name).suffix.lower() in _DEFAULT_IGNORE_EXTS
-
-    def _walk(
+    def _iter_walk(
         self,
-        path: Path,
-        lines: List[str],
-        current_depth: int,
+        path,
         max_depth: int,
         show_hidden: bool,
-        counter: List[int],
-    ) -> None:
-        if counter[0] >= _MAX_ENTRIES:
-            return
+    ) -> Iterator[Tuple[str, bool]]:
+        """
+        Yield (line, is_entry) for the tree under `path`.
 
-        try:
-            items = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
-        except PermissionError:
-            lines.append("  " * (current_depth + 1) + "[Permission Denied]")
-            return
-        except Exception as e:
-            lines.append("  " * (current_depth + 1) + f"[Error: {e}]")
-            return
+        is_entry is False for notes such as "[Permission Denied]" that do not
+        count towards the entry cap. Iterative pre-order traversal: an explicit
+        stack replaces recursion. Items are ("scan", path, depth),
+        ("dir", entry, depth) and ("files", entries, depth). Each directory's
+        children are pushed in reverse so they pop as sub-directories first,
+        then files. Only one directory's listing is buffered for sorting.
+        """
+        indents = ["  " * (d + 1) for d in range(max(max_depth, 1) + 1)]
+        stack = [("scan", path, 0)]
 
-        indent = "  " * (current_depth + 1)
+        while stack:
+            kind, target, depth = stack.pop()
+            indent = indents[depth]
 
-        for item in items:
-            if counter[0] >= _MAX_ENTRIES:
-                break
+            if kind == "files":
+                for item in target:
+                    try:
+                        size_str = _fmt_size(item.stat().st_size)
+                    except OSError:
+                        size_str = "?"
+                    yield f"{indent}📄 {item.name}  [{size_str}]", True
 
-            if item.is_dir():
-                if self._is_ignored_dir(item.name, show_hidden):
-                    continue
-                lines.append(f"{indent}📂 {item.name}/")
-                counter[0] += 1
-                if current_depth < max_depth - 1:
-                    self._walk(item, lines, current_depth + 1, max_depth, show_hidden, counter)
+            elif kind == "dir":
+                line = f"{indent}📂 {target.name}/"
+                if depth < max_depth - 1:
+                    stack.append(("scan", target.path, depth + 1))
                 else:
                     # Peek: show if there's anything inside
                     try:
-                        inner = [
-                            c for c in item.iterdir()
-                            if not self._is_ignored_dir(c.name, show_hidden)
-                            and not self._is_ignored_file(c.name, show_hidden)
-                        ]
+                        with os.scandir(target.path) as inner_it:
+                            inner = sum(
+                                1 for c in inner_it
+                                if not _is_ignored_dir(c.name, show_hidden)
+                                and not _is_ignored_file(c.name, show_hidden)
+                            )
                         if inner:
-                            lines.append(f"{indent}    … ({len(inner)} item(s))")
+                            line += f"\n{indent}    … ({inner} item(s))"
                     except Exception:
                         pass
-            elif item.is_file():
-                if self._is_ignored_file(item.name, show_hidden):
-                    continue
+                yield line, True
+
+            else:
+                # DirEntry caches the file type from the directory read itself,
+                # so is_dir()/is_file() cost no extra stat() per entry. Ignored
+                # names are dropped here, before sorting, and never descended
+                # into. Ignore rules are inlined (see _is_ignored_dir/_file).
+                dirs = []
+                files = []
                 try:
-                    size = item.stat().st_size
-                    size_str = _fmt_size(size)
-                except OSError:
-                    size_str = "?"
-                lines.append(f"{indent}📄 {item.name}  [{size_str}]")
-                counter[0] += 1
+                    with os.scandir(target) as it:
+                        for entry in it:
+                            name = entry.name
+                            if not show_hidden and name[:1] == ".":
+                                continue
+                            if entry.is_dir():
+                                if name in _DEFAULT_IGNORE_DIRS or name.endswith(_IGNORE_DIR_SUFFIXES):
+                                    continue
+                                dirs.append(entry)
+                            elif entry.is_file():
+                                dot = name.rfind(".")
+                                if dot > 0 and name[dot:].lower() in _DEFAULT_IGNORE_EXTS:
+                                    continue
+                                files.append(entry)
+                except PermissionError:
+                    yield f"{indent}[Permission Denied]", False
+                    continue
+                except Exception as e:
+                    yield f"{indent}[Error: {e}]", False
+                    continue
+
+                if files:
+                    files.sort(key=lambda e: e.name.lower())
+                    stack.append(("files", files, depth))
+                dirs.sort(key=lambda e: e.name.lower())
+                stack.extend(("dir", entry, depth) for entry in reversed(dirs))
 
 
 # ---------------------------------------------------------------------------
+def _decode_text(data) -> str:
+    """
+    Decode bytes (or any buffer, e.g. an mmap) read in binary mode.
+
+    Tries strict UTF-8 first and falls back to replacing invalid bytes on the
+    same in-memory buffer, so the file is never re-read. Newlines are
+    translated as text-mode open() would.
+    """
+    try:
+        text = str(data, "utf-8")
+    except UnicodeDecodeError:
+        text = str(data, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_text(file_path: str, content: str) -> None:
+    """Write content as UTF-8, bypassing the io stack for large strings."""
+    if len(content) < _RAW_WRITE_THRESHOLD:
+        with open(file_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(content)
+        return
+
+    if os.linesep != "\n":
+        # Match text mode's newline translation (\r\n on Windows)
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(file_path, flags, 0o666)
+    try:
+        written = 0
+        while written < len(data):
+            # os.write may accept less than requested (pipes, signals, quotas)
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+def _ensure_dir(directory: str) -> None:
+    """Create directory (and parents) unless it is already known to exist."""
+    if directory in _ENSURED_DIRS:
+        return
+    os.makedirs(directory, exist_ok=True)
+    if len(_ENSURED_DIRS) >= _MAX_ENSURED_DIRS:
+        _ENSURED_DIRS.clear()
+    _ENSURED_DIRS.add(directory)
+
+
+def _is_ignored_dir(name: str, show_hidden: bool) -> bool:
+    if not show_hidden and name[:1] == ".":
+        return True
+    return name in _DEFAULT_IGNORE_DIRS or name.endswith(_IGNORE_DIR_SUFFIXES)
+
+
+def _is_ignored_file(name: str, show_hidden: bool) -> bool:
+    if not show_hidden and name[:1] == ".":
+        return True
+    # Same as Path(name).suffix, without building a Path per entry
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in _DEFAULT_IGNORE_EXTS
+
+
 def _fmt_size(size: int) -> str:
     """Human-readable file size."""
     for unit in ("B", "KB", "MB", "GB"):
@@ -22,19 +22,27 @@ Adding a new MCP server requires ONLY a JSON entry in the config:
 
 Uses a lightweight raw JSON-RPC stdio transport (no mcp/fastmcp
 client library required) for maximum compatibility.
+
+With SEEKER_MCP_LAZY=true the tool list from the last live discovery
+(config/.mcp_tools_cache.json) is reused and each server is only
+spawned when one of its tools is first executed.
 """
 
 from __future__ import annotations
 
 import sys as _sys
 
+import atexit
+import hashlib
 import json
 import os
-import subprocess
+import queue
 import threading
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from .base import BaseTool
 
@@ -43,19 +51,39 @@ from .base import BaseTool
 # Config
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _load_mcp_config() -> Dict[str, Any]:
-    """Return the 'mcpServers' dict from config/mcp_servers.json."""
-    config_path = Path(__file__).parent.parent / "config" / "mcp_servers.json"
-    if not config_path.exists():
+_CONFIG_PATH = Path(__file__).parent.parent / "config" / "mcp_servers.json"
+
+
+def _config_mtime() -> Optional[int]:
+    """mtime of mcp_servers.json in ns, or None if it does not exist."""
+    try:
+        return _CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _parse_mcp_config(mtime: Optional[int]) -> Dict[str, Any]:
+    """Parse the config; keyed on mtime so an edited file is re-read."""
+    if mtime is None:
         return {}
-    with open(config_path, "r", encoding="utf-8") as fh:
+    with open(_CONFIG_PATH, "r", encoding="utf-8") as fh:
         return json.load(fh).get("mcpServers", {})
 
 
+def _load_mcp_config() -> Dict[str, Any]:
+    """Return the 'mcpServers' dict from config/mcp_servers.json."""
+    return _parse_mcp_config(_config_mtime())
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Raw JSON-RPC stdio MCP client
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Shared compact encoder (no per-message encoder setup or kwargs parsing)
+_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
 class _MCPSession:
     """
     Lightweight MCP client that speaks JSON-RPC 2.0 over stdio.
@@ -73,6 +101,10 @@ class _MCPSession:
         if command.lower() in ("python", "python3"):
             resolved_cmd = _sys.executable
 
+        # Imported here so loading this module costs nothing until a server
+        # is actually spawned
+        import subprocess
+
         self._proc = subprocess.Popen(
             [resolved_cmd] + args,
             stdin=subprocess.PIPE,
@@ -81,45 +113,93 @@ class _MCPSession:
             env=merged_env,
         )
         self._lock = threading.Lock()
+        self._sbuf = bytearray()    # reused outgoing frame, see _send
+        self._pending_prelude = b""  # notification prepended to the next frame
         self._req_id = 0
         self._initialized = False
 
+        # Pipes can't be select()ed on Windows, so reader threads move
+        # stdout lines into a queue (giving _recv a real timeout) and keep
+        # stderr drained so a chatty server can't block on a full pipe.
+        self._lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._stderr_tail: Deque[str] = deque(maxlen=20)
+        self._stdout_reader = threading.Thread(target=self._pump_stdout, daemon=True)
+        self._stderr_reader = threading.Thread(target=self._pump_stderr, daemon=True)
+        self._stdout_reader.start()
+        self._stderr_reader.start()
+
+    # ── pipe readers ──────────────────────────────────────────────────────────
+
+    def _pump_stdout(self) -> None:
+        try:
+            for line in self._proc.stdout:
+                self._lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._lines.put(None)    # EOF: server exited or pipe closed
+
+    def _pump_stderr(self) -> None:
+        try:
+            for line in self._proc.stderr:
+                self._stderr_tail.append(line.decode(errors="replace"))
+        except (OSError, ValueError):
+            pass
+
     # ── low-level JSON-RPC ────────────────────────────────────────────────────
 
     def _next_id(self) -> int:
         self._req_id += 1
         return self._req_id
 
-    def _send(self, method: str, params: Any = None, req_id: Any = None) -> None:
-        msg: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+    def _send(self, method: str, params: Any = None, req_id: Optional[int] = None) -> None:
+        # Only method/id/params vary, so frame the envelope directly into a
+        # reused per-session buffer rather than building a dict, a joined str
+        # and its encoded copy per message. Callers hold self._lock.
+        buf = self._sbuf
+        buf.clear()
+        if self._pending_prelude:
+            # Deferred notification rides along in the same write()
+            buf += self._pending_prelude
+            self._pending_prelude = b""
+        buf += b'{"jsonrpc":"2.0","method":'
+        buf += _ENCODE(method).encode("utf-8")
         if req_id is not None:
-            msg["id"] = req_id
+            buf += b',"id":%d' % req_id
         if params is not None:
-            msg["params"] = params
-        line = json.dumps(msg, separators=(",", ":")) + "\n"
-        self._proc.stdin.write(line.encode())
+            buf += b',"params":'
+            buf += _ENCODE(params).encode("utf-8")
+        buf += b"}\n"
+        # write() copies into the pipe's buffer, so buf is free on return
+        self._proc.stdin.write(buf)
         self._proc.stdin.flush()
 
     def _recv(self, timeout: float = 30.0) -> Dict[str, Any]:
         """Read the next complete JSON-RPC message from stdout."""
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            # Check process is alive
-            if self._proc.poll() is not None:
-                # Drain stderr for a useful error message
-                stderr_out = ""
-                try:
-                    stderr_out = self._proc.stderr.read().decode(errors="replace").strip()
-                except Exception:
-                    pass
-                hint = f"\n  stderr: {stderr_out[-400:]}" if stderr_out else ""
-                raise RuntimeError(f"MCP server process has exited (code {self._proc.returncode}){hint}")
-            line = self._proc.stdout.readline()
+        while True:
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError("Timed out waiting for MCP server response") from None
+            if line is None:
+                self._lines.put(None)    # keep EOF visible to later calls
+                self._raise_exited()
+            line = line.strip()
             if line:
-                line = line.strip()
-                if line:
-                    return json.loads(line)
-        raise TimeoutError("Timed out waiting for MCP server response")
+                return json.loads(line)
+
+    def _raise_exited(self) -> None:
+        """Raise with the exit code and the tail of stderr for diagnostics."""
+        import subprocess
+
+        try:
+            self._proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        self._stderr_reader.join(timeout=1)
+        stderr_out = "".join(self._stderr_tail).strip()
+        hint = f"\n  stderr: {stderr_out[-400:]}" if stderr_out else ""
+        raise RuntimeError(f"MCP server process has exited (code {self._proc.returncode}){hint}")
 
     def _request(self, method: str, params: Any = None, timeout: float = 30.0) -> Any:
         """Send a request and return result (raises on error)."""
@@ -148,8 +228,9 @@ class _MCPSession:
             "clientInfo": {"name": "seeker-agent", "version": "1.0.0"},
         }
         self._request("initialize", params)
-        # Send initialized notification (required by MCP spec)
-        self._send("notifications/initialized")
+        # The initialized notification (required by MCP spec) is sent with the
+        # first real request, saving a write/flush round per session
+        self._pending_prelude = b'{"jsonrpc":"2.0","method":"notifications/initialized"}\n'
         self._initialized = True
 
     # ── Tool operations ────────────────────────────────────────────────────────
@@ -180,15 +261,15 @@ class _MCPSession:
             self._proc.stdin.close()
         except Exception:
             pass
-        try:
-            self._proc.stderr.close()
-        except Exception:
-            pass
         try:
             self._proc.terminate()
             self._proc.wait(timeout=3)
         except Exception:
             pass
+        # The reader threads own stdout/stderr; they finish on EOF once the
+        # process is gone (closing a pipe mid-read would block on its lock).
+        self._stdout_reader.join(timeout=1)
+        self._stderr_reader.join(timeout=1)
 
     def __enter__(self):
         self.initialize()
@@ -198,6 +279,61 @@ class _MCPSession:
         self.close()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Session cache — one long-lived server process per MCP server
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SESSIONS: Dict[str, _MCPSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+# Per-server locks so spawning one server never blocks another
+_SERVER_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def _get_session(server_name: str, server_config: Dict[str, Any]) -> _MCPSession:
+    """Return the initialized session for a server, (re)spawning it if needed."""
+    sess = _SESSIONS.get(server_name)
+    if sess is not None and sess._proc.poll() is None:
+        return sess
+
+    with _SESSIONS_LOCK:
+        server_lock = _SERVER_LOCKS.setdefault(server_name, threading.Lock())
+
+    with server_lock:
+        sess = _SESSIONS.get(server_name)
+        if sess is not None and sess._proc.poll() is None:
+            return sess
+        if sess is not None:
+            sess.close()
+
+        env = server_config.get("env") or {}
+        sess = _MCPSession(server_config["command"], server_config.get("args", []), env)
+        try:
+            sess.initialize()
+        except Exception:
+            sess.close()
+            raise
+        with _SESSIONS_LOCK:
+            _SESSIONS[server_name] = sess
+        return sess
+
+
+def _drop_session(server_name: str) -> None:
+    """Close and forget a server's cached session."""
+    with _SESSIONS_LOCK:
+        sess = _SESSIONS.pop(server_name, None)
+    if sess is not None:
+        sess.close()
+
+
+@atexit.register
+def _close_all_sessions() -> None:
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for sess in sessions:
+        sess.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Dynamic BaseTool wrapper — one per MCP tool per server
 # ─────────────────────────────────────────────────────────────────────────────
@@ -205,10 +341,19 @@ class _MCPSession:
 class MCPToolWrapper(BaseTool):
     """Proxies a single tool from a remote MCP server as a Seeker BaseTool."""
 
+    __slots__ = ('_server_name', '_server_config', '_tool_name')
+
     # Set via dynamic subclass (required by BaseTool)
     name: str = ""
     description: str = ""
 
+    # MCP servers can expose dozens of tools; load schemas via discover_tool
+    defer: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        # Per-tool subclasses are built and registered by discover_mcp_tools
+        super().__init_subclass__(register=False, **kwargs)
+
     def __init__(
         self,
         server_name: str,
@@ -220,36 +365,37 @@ class MCPToolWrapper(BaseTool):
         self._server_name = server_name
         self._server_config = server_config
         self._tool_name = tool_name          # raw upstream name (no prefix)
-        self._input_schema = tool_input_schema
         super().__init__()
 
-    # ── Schema ────────────────────────────────────────────────────────────────
-
-    def get_schema(self) -> Dict[str, Any]:
-        props = self._input_schema.get("properties", {})
-        required = self._input_schema.get("required", [])
-        return {
+        # The upstream schema never changes, so build the LLM schema once
+        self._schema_cache = {
             "type": "function",
             "function": {
                 "name": self.name,
                 "description": self.description,
                 "parameters": {
                     "type": "object",
-                    "properties": props,
-                    "required": required,
+                    "properties": tool_input_schema.get("properties", {}),
+                    "required": tool_input_schema.get("required", []),
                 },
             },
         }
 
+    # ── Schema ────────────────────────────────────────────────────────────────
+
+    def get_schema(self) -> Dict[str, Any]:
+        return self._schema_cache
+
     # ── Execution ─────────────────────────────────────────────────────────────
 
     def execute(self, **kwargs) -> str:
-        cfg = self._server_config
-        env = cfg.get("env") or {}
         try:
-            with _MCPSession(cfg["command"], cfg.get("args", []), env) as sess:
-                return sess.call_tool(self._tool_name, kwargs)
+            sess = _get_session(self._server_name, self._server_config)
+            return sess.call_tool(self._tool_name, kwargs)
         except Exception as exc:
+            # Broken pipe / timeout: the session is unusable, respawn next call
+            if isinstance(exc, OSError):
+                _drop_session(self._server_name)
             return f"[MCP:{self._server_name}] Error calling '{self._tool_name}': {exc}"
 
 
@@ -257,66 +403,144 @@ class MCPToolWrapper(BaseTool):
 # Discovery
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _discover_server_tools(
+_TOOLS_CACHE_PATH = _CONFIG_PATH.with_name(".mcp_tools_cache.json")
+
+
+def _load_tools_cache() -> Dict[str, Any]:
+    try:
+        with open(_TOOLS_CACHE_PATH, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_tools_cache(cache: Dict[str, Any]) -> None:
+    try:
+        with open(_TOOLS_CACHE_PATH, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh, indent=2)
+    except OSError as exc:
+        print(f"   ⚠️  Could not write MCP tool cache: {exc}")
+
+
+def _server_fingerprint(server_config: Dict[str, Any]) -> str:
+    """
+    Hash of the parts of a server entry that can change which tools it exposes.
+
+    Hashed because env often holds API keys and the result is written to disk.
+    """
+    parts = [server_config["command"], server_config.get("args", []),
+             server_config.get("env") or {}]
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _list_server_tools(
     server_name: str,
     server_config: Dict[str, Any],
-) -> List[MCPToolWrapper]:
-    """Spawn the server, list its tools, return wrappers."""
-    env = server_config.get("env") or {}
-    wrappers: List[MCPToolWrapper] = []
-    try:
-        with _MCPSession(server_config["command"], server_config.get("args", []), env) as sess:
-            tools = sess.list_tools()
-
-        for tool in tools:
-            tool_name: str = tool["name"]
-            desc: str = tool.get("description") or f"MCP tool '{tool_name}' from {server_name}"
-            schema: Dict = tool.get("inputSchema") or {}
-
-            # Prefix to avoid name collisions between servers
-            seeker_name = f"mcp_{server_name.lower()}_{tool_name}"
-
-            # Unique subclass so BaseTool sees name/description as class attrs
-            wrapper_cls = type(
-                f"MCP_{server_name}_{tool_name}",
-                (MCPToolWrapper,),
-                {"name": seeker_name, "description": desc},
-            )
-            instance = wrapper_cls(
-                server_name=server_name,
-                server_config=server_config,
-                tool_name=tool_name,
-                tool_description=desc,
-                tool_input_schema=schema,
-            )
-            wrappers.append(instance)
-            print(f"   ↳ [{server_name}] {tool_name} → {seeker_name}")
+    cache: Dict[str, Any],
+    lazy: bool,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return a server's tool list, from the cache in lazy mode.
+
+    A live listing spawns the server and refreshes the cache entry; a cache
+    hit leaves the server unstarted until one of its tools is executed.
+    """
+    fingerprint = _server_fingerprint(server_config)
+    entry = cache.get(server_name)
+    if lazy and entry and entry.get("fingerprint") == fingerprint:
+        return entry["tools"]
 
+    try:
+        tools = _get_session(server_name, server_config).list_tools()
     except Exception as exc:
         print(f"   ✗ Could not connect to MCP server '{server_name}': {exc}")
+        return None
+    cache[server_name] = {"fingerprint": fingerprint, "tools": tools}
+    return tools
+
+
+def _build_server_tools(
+    server_name: str,
+    server_config: Dict[str, Any],
+    tools: List[Dict[str, Any]],
+) -> List[MCPToolWrapper]:
+    """Wrap each listed tool in its own MCPToolWrapper subclass."""
+    wrappers: List[MCPToolWrapper] = []
+    for tool in tools:
+        tool_name: str = tool["name"]
+        desc: str = tool.get("description") or f"MCP tool '{tool_name}' from {server_name}"
+        schema: Dict = tool.get("inputSchema") or {}
+
+        # Prefix to avoid name collisions between servers
+        seeker_name = f"mcp_{server_name.lower()}_{tool_name}"
+
+        # Unique subclass so BaseTool sees name/description as class attrs
+        wrapper_cls = type(
+            f"MCP_{server_name}_{tool_name}",
+            (MCPToolWrapper,),
+            {
+                "__slots__": (),
+                "name": seeker_name,
+                "description": desc,
+                "search_hint": f"{server_name} {server_config.get('description', '')}",
+            },
+        )
+        instance = wrapper_cls(
+            server_name=server_name,
+            server_config=server_config,
+            tool_name=tool_name,
+            tool_description=desc,
+            tool_input_schema=schema,
+        )
+        wrappers.append(instance)
+        print(f"   ↳ [{server_name}] {tool_name} → {seeker_name}")
 
     return wrappers
 
 
-def discover_mcp_tools() -> List[MCPToolWrapper]:
+def discover_mcp_tools(lazy: bool = False) -> List[MCPToolWrapper]:
     """
     Called by ToolRegistry.auto_discover_tools().
 
     Reads config/mcp_servers.json and returns all tool wrappers from
-    all enabled servers, ready to register with Seeker.
+    all enabled servers, ready to register with Seeker. With lazy=True
+    (Settings.mcp_lazy) cached tool lists are reused and servers start on
+    first use; the cache file is only read and written in that mode.
     """
     servers = _load_mcp_config()
     if not servers:
         return []
 
-    all_tools: List[MCPToolWrapper] = []
+    enabled: List[str] = []
     for server_name, server_cfg in servers.items():
         if not server_cfg.get("enabled", True):
             print(f"   ⊘ Skipping disabled MCP server: {server_name}")
             continue
-
         print(f"   🔌 Connecting to MCP server: {server_name}")
-        found = _discover_server_tools(server_name, server_cfg)
-        all_tools.extend(found)
+        enabled.append(server_name)
+
+    if not enabled:
+        return []
+
+    # In lazy mode servers with a cached tool list are not spawned here;
+    # MCPToolWrapper.execute starts them on first use via _get_session
+    cache = _load_tools_cache() if lazy else {}
+    before = json.dumps(cache, sort_keys=True)
+
+    # Handshakes are I/O-bound and independent, so connect to all servers at
+    # once; startup then costs the slowest server rather than the sum.
+    with ThreadPoolExecutor(max_workers=min(8, len(enabled))) as executor:
+        found = list(executor.map(
+            lambda name: _list_server_tools(name, servers[name], cache, lazy), enabled
+        ))
+
+    if lazy and json.dumps(cache, sort_keys=True) != before:
+        _save_tools_cache(cache)
+
+    # Built in config order so registration order stays stable
+    all_tools: List[MCPToolWrapper] = []
+    for name, tools in zip(enabled, found):
+        if tools is not None:
+            all_tools.extend(_build_server_tools(name, servers[name], tools))
 
     return all_tools
@@ -1,13 +1,48 @@
 """Memory management tools for the agent."""
 from tools.base import BaseTool
+from tools._async_writer import artifact_writer
 from typing import Optional
 from pathlib import Path
 from datetime import datetime
 
+# Resolved once at import rather than per save
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_INSIGHT_DIR = _PROJECT_ROOT / "Agent_Insight"
+_INSIGHT_DIR_READY = False
+
+# Extensions save_insight keeps as-is; anything else gets '.md' appended
+_TEXT_EXTS = ('.md', '.txt')
+
+# Fixed parts of the summarize_memory reply; only the filename varies per call
+_SUMMARY_HEADER = "Memory summarization requested.\n\n"
+_SAVE_TMPL = (
+    "Summary will be saved to: Agent_Insight/{fn}\n"
+    "\nTo complete this action, the agent's _summarize_memory() method will be called "
+    "and the result will be saved to the specified file.\n"
+)
+_NOSAVE_BODY = (
+    "Summary will be generated but not saved permanently.\n"
+    "Use save_to_insight=true to save to Agent_Insight folder.\n"
+)
+_HELP_TAIL = (
+    "\nMemory summarization helps:\n"
+    "- Save important discoveries before they're forgotten\n"
+    "- Reduce context size when prompts get too long\n"
+    "- Create checkpoints of your progress\n"
+)
+
+_CLEAR_REPLY = (
+    "Memory clear requested. This will remove all current memory entries.\n"
+    "⚠️ WARNING: Consider using 'summarize_memory' with save_to_insight=true "
+    "before clearing to preserve important information!"
+)
+
 
 class SummarizeMemoryTool(BaseTool):
     """Tool for summarizing agent's memory."""
     
+    __slots__ = ()
+    
     name = "summarize_memory"
     description = "Summarize your current memory and optionally save it to Agent_Insight folder for permanent storage"
     parameters = {
@@ -33,39 +68,17 @@ class SummarizeMemoryTool(BaseTool):
             Summary of memory and confirmation message
         """
         try:
-            # Get the agent instance (passed during tool execution)
-            # This is a bit of a hack, but necessary since tools don't have direct access to agent
-            import sys
-            from pathlib import Path
-            
-            # Add parent directory to path
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            
-            # Import here to avoid circular dependency
-            from core.memory import MemoryManager
-            
             # Note: In actual execution, the agent will pass itself to the tool
             # For now, we'll return instructions on how to use this
             
-            result = "Memory summarization requested.\n\n"
-            
             if save_to_insight:
                 if not filename:
                     filename = f"memory_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                
-                result += f"Summary will be saved to: Agent_Insight/{filename}\n"
-                result += "\nTo complete this action, the agent's _summarize_memory() method will be called "
-                result += "and the result will be saved to the specified file.\n"
+                body = _SAVE_TMPL.format(fn=filename)
             else:
-                result += "Summary will be generated but not saved permanently.\n"
-                result += "Use save_to_insight=true to save to Agent_Insight folder.\n"
+                body = _NOSAVE_BODY
             
-            result += "\nMemory summarization helps:\n"
-            result += "- Save important discoveries before they're forgotten\n"
-            result += "- Reduce context size when prompts get too long\n"
-            result += "- Create checkpoints of your progress\n"
-            
-            return result
+            return "".join((_SUMMARY_HEADER, body, _HELP_TAIL))
             
         except Exception as e:
             return f"Error summarizing memory: {str(e)}"
@@ -74,6 +87,8 @@ class SummarizeMemoryTool(BaseTool):
 class ClearMemoryTool(BaseTool):
     """Tool for clearing agent's memory."""
     
+    __slots__ = ()
+    
     name = "clear_memory"
     description = "Clear your current memory (use with caution! Consider summarizing first)"
     parameters = {}
@@ -85,14 +100,14 @@ class ClearMemoryTool(BaseTool):
         Returns:
             Confirmation message
         """
-        return ("Memory clear requested. This will remove all current memory entries.\n"
-                "⚠️ WARNING: Consider using 'summarize_memory' with save_to_insight=true "
-                "before clearing to preserve important information!")
+        return _CLEAR_REPLY
 
 
 class SaveInsightTool(BaseTool):
     """Tool for saving important information to Agent_Insight folder."""
     
+    __slots__ = ()
+    
     name = "save_insight"
     description = "Save important information, tips, or discoveries to Agent_Insight folder for permanent memory"
     parameters = {
@@ -118,22 +133,19 @@ class SaveInsightTool(BaseTool):
             Confirmation message
         """
         try:
-            from pathlib import Path
-            
-            # Get project root
-            project_root = Path(__file__).parent.parent
-            insight_dir = project_root / "Agent_Insight"
-            
-            # Create directory if it doesn't exist
-            insight_dir.mkdir(exist_ok=True)
+            global _INSIGHT_DIR_READY
+            if not _INSIGHT_DIR_READY:
+                # Create directory if it doesn't exist (once per process)
+                _INSIGHT_DIR.mkdir(exist_ok=True)
+                _INSIGHT_DIR_READY = True
             
             # Ensure filename has .md extension
-            if not filename.endswith('.md') and not filename.endswith('.txt'):
+            if not filename.endswith(_TEXT_EXTS):
                 filename += '.md'
             
-            # Write file
-            filepath = insight_dir / filename
-            filepath.write_text(content, encoding='utf-8')
+            # Written on a background thread; the agent flushes on exit
+            filepath = _INSIGHT_DIR / filename
+            artifact_writer.submit(filepath, content)
             
             return f"✅ Saved to Agent_Insight/{filename}\n\nThis information is now permanently stored and will be loaded in future sessions!"
             
@@ -1,14 +1,55 @@
 """Ollama tools for Seeker agent."""
-import ollama
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from .base import BaseTool
 
+# One client for every Ollama tool call, created on first use so importing
+# this module does not load the ollama package; Client() reads OLLAMA_HOST
+_OLLAMA = None
+_OLLAMA_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the shared ollama.Client, importing ollama on first use."""
+    global _OLLAMA
+    if _OLLAMA is None:
+        with _OLLAMA_LOCK:
+            if _OLLAMA is None:
+                import ollama
+                _OLLAMA = ollama.Client()
+    return _OLLAMA
+
+
+# Upper bound on concurrent chat requests from one execute_batch
+_MAX_PARALLEL_CHATS = 8
+
+# Local models from ollama list(), refreshed at most every _MODEL_TTL seconds:
+# "names" for membership checks, "reply" is the ready-made listing
+_MODEL_CACHE: Dict[str, Any] = {"names": None, "reply": "", "ts": 0.0}
+_MODEL_TTL = 30.0
+
+
+def _get_models() -> Dict[str, Any]:
+    """Return the model cache, querying the Ollama server only when stale."""
+    if _MODEL_CACHE["names"] is None or time.monotonic() - _MODEL_CACHE["ts"] > _MODEL_TTL:
+        response = _get_client().list()
+        names = [model['name'] for model in response['models']]
+        _MODEL_CACHE["reply"] = "Available Ollama models: " + ", ".join(names)
+        _MODEL_CACHE["names"] = frozenset(names)
+        _MODEL_CACHE["ts"] = time.monotonic()
+    return _MODEL_CACHE
+
 
 class OllamaChatTool(BaseTool):
     """Tool for chatting with Ollama models directly."""
     
+    __slots__ = ()
+    
     name = "ollama_chat"
     description = "Chat with an Ollama model directly"
+    parallel_safe = True
     parameters = {
         "model": {
             "type": "string",
@@ -52,7 +93,7 @@ class OllamaChatTool(BaseTool):
             if options:
                 opts.update(options)
             
-            response = ollama.chat(
+            response = _get_client().chat(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 options=opts
@@ -61,11 +102,26 @@ class OllamaChatTool(BaseTool):
             return response['message']['content']
         except Exception as e:
             return f"Error chatting with Ollama model: {str(e)}"
+    
+    def execute_batch(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """
+        Run several chats at once over the shared client.
+        
+        Each prompt is still its own request; sending them together overlaps
+        the round-trips and lets the Ollama server schedule them in parallel
+        (OLLAMA_NUM_PARALLEL). Results keep the order of batch.
+        """
+        if len(batch) < 2:
+            return [self.execute(**kwargs) for kwargs in batch]
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_CHATS, len(batch))) as executor:
+            return list(executor.map(lambda kwargs: self.execute(**kwargs), batch))
 
 
 class OllamaListModelTool(BaseTool):
     """Tool for listing available Ollama models."""
     
+    __slots__ = ()
+    
     name = "ollama_list_models"
     description = "List all available Ollama models"
     
@@ -77,9 +133,7 @@ class OllamaListModelTool(BaseTool):
             List of available Ollama models
         """
         try:
-            response = ollama.list()
-            models = [model['name'] for model in response['models']]
-            return f"Available Ollama models: {', '.join(models)}"
+            return _get_models()["reply"]
         except Exception as e:
             return f"Error listing Ollama models: {str(e)}"
 
@@ -87,6 +141,8 @@ class OllamaListModelTool(BaseTool):
 class OllamaPullModelTool(BaseTool):
     """Tool for pulling Ollama models."""
     
+    __slots__ = ()
+    
     name = "ollama_pull_model"
     description = "Pull/download an Ollama model"
     parameters = {
@@ -107,8 +163,14 @@ class OllamaPullModelTool(BaseTool):
             Status of the pull operation
         """
         try:
+            # Untagged names are stored as "<name>:latest"
+            names = _get_models()["names"]
+            if model in names or f"{model}:latest" in names:
+                return f"Already pulled: {model}"
+            
             # This will pull the model if it doesn't exist
-            response = ollama.pull(model)
+            response = _get_client().pull(model)
+            _MODEL_CACHE["names"] = None    # list changed; refresh on next read
             return f"Successfully pulled model: {model}"
         except Exception as e:
             return f"Error pulling Ollama model: {str(e)}"
@@ -1,12 +1,119 @@
 """PDF extraction tool for Seeker agent."""
-from typing import Dict, Any
+import atexit
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterator, Optional
 from .base import BaseTool
-import PyPDF2
+
+
+# Below this many pages, worker start-up costs more than it saves
+_PARALLEL_MIN_PAGES = 32
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool():
+    """Process pool shared across calls (workers are slow to spawn on Windows)."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn on every platform: forking a process that runs agent and
+            # server threads can copy held locks into the workers
+            _POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_POOL.shutdown)
+        return _POOL
+
+
+def _discard_pool(pool):
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False)
+
+
+# pypdfium2 module, None when it is not installed, _UNSET until first checked
+_UNSET = object()
+_PDFIUM = _UNSET
+
+
+def _import_pdfium():
+    """Return pypdfium2 or None, trying the import only once per process."""
+    global _PDFIUM
+    if _PDFIUM is _UNSET:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            pdfium = None
+        _PDFIUM = pdfium
+    return _PDFIUM
+
+
+def _page_count(pdf_path: str) -> int:
+    """Number of pages in the PDF."""
+    pdfium = _import_pdfium()
+    if pdfium is None:
+        import PyPDF2
+
+        with open(pdf_path, 'rb') as file:
+            return len(PyPDF2.PdfReader(file).pages)
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _iter_page_text(pdf_path: str, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of pages [start, end) in order.
+
+    Uses pypdfium2 (pdfium's C++ engine) when it is installed and falls back
+    to the pure-Python PyPDF2 reader otherwise.
+    """
+    pdfium = _import_pdfium()
+    if pdfium is None:
+        import PyPDF2
+
+        with open(pdf_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages[start:end]:
+                yield page.extract_text()
+        return
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for index in range(start, len(pdf) if end is None else end):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                # pdfium separates lines with \r\n
+                yield textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _extract_pages(pdf_path: str, start: int, end: int) -> str:
+    """Text of pages [start, end); top-level so worker processes can run it."""
+    return "".join(text + "\n" for text in _iter_page_text(pdf_path, start, end))
 
 
 class PDFExtractorTool(BaseTool):
     """Tool for extracting text from PDF files."""
     
+    __slots__ = ()
+    
     name = "pdf_extractor"
     description = "Extract text content from a PDF file"
     parameters = {
@@ -27,16 +134,22 @@ class PDFExtractorTool(BaseTool):
             str: Extracted text from the PDF
         """
         try:
-            # Open the PDF file
-            with open(pdf_path, 'rb') as file:
-                # Create PDF reader object
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Extract text from all pages
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                
-                return text
+            n_pages = _page_count(pdf_path)
+            workers = os.cpu_count() or 1
+            if n_pages < _PARALLEL_MIN_PAGES or workers < 2:
+                return _extract_pages(pdf_path, 0, n_pages)
+
+            # Extraction is CPU-bound, so shard the page range across processes;
+            # map() returns shards in page order
+            step = -(-n_pages // workers)
+            starts = range(0, n_pages, step)
+            ends = [min(i + step, n_pages) for i in starts]
+            pool = _get_pool()
+            try:
+                return "".join(pool.map(_extract_pages, [pdf_path] * len(ends), starts, ends))
+            except BrokenProcessPool:
+                # A worker died (OOM, crash in pdfium); finish in this process
+                _discard_pool(pool)
+                return _extract_pages(pdf_path, 0, n_pages)
         except Exception as e:
             return f"Error extracting text from PDF: {str(e)}"
\ No newline at end of file
@@ -1,15 +1,28 @@
 """System tools for Seeker agent."""
 import subprocess
 import os
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .base import BaseTool
 from core.tool_queue import tool_queue
 
+# [epoch second, its isoformat()] for GetTimeTool
+_LAST_TIME: List[Any] = [None, ""]
+
+# Reply for a command awaiting approval
+_QUEUED_TMPL = (
+    "⏳ Command queued for approval (ID: {tid}...)\n"
+    "Command: {cmd}\n"
+    "Status: Waiting for user approval via web interface"
+)
+
 
 class ExecuteCommandTool(BaseTool):
     """Tool for executing system commands."""
     
+    __slots__ = ()
+    
     name = "execute_command"
     description = "Execute a system command and return output (requires user approval)"
     parameters = {
@@ -34,9 +47,7 @@ class ExecuteCommandTool(BaseTool):
             )
             
             # Return pending status immediately
-            return f"⏳ Command queued for approval (ID: {tool_id[:8]}...)\n" \
-                   f"Command: {command}\n" \
-                   f"Status: Waiting for user approval via web interface"
+            return _QUEUED_TMPL.format(tid=tool_id[:8], cmd=command)
             
         except Exception as e:
             return f"Error queueing command: {str(e)}"
@@ -45,17 +56,34 @@ class ExecuteCommandTool(BaseTool):
 class GetTimeTool(BaseTool):
     """Tool for getting current time."""
     
+    __slots__ = ()
+    
     name = "get_time"
     description = "Get the current date and time"
+    parameters = {
+        "precision": {
+            "type": "string",
+            "description": "'second' (default) or 'microsecond' for a high-resolution timestamp"
+        }
+    }
     
-    def execute(self) -> str:
+    def execute(self, precision: str = "second") -> str:
         """Return current timestamp."""
-        return datetime.now().isoformat()
+        if precision == "microsecond":
+            return datetime.now().isoformat()
+        
+        # Reuse the formatted string while still within the same second
+        now = int(time.time())
+        if now != _LAST_TIME[0]:
+            _LAST_TIME[:] = [now, datetime.fromtimestamp(now).isoformat()]
+        return _LAST_TIME[1]
 
 
 class WaitForTaskTool(BaseTool):
     """Tool for waiting for new user input."""
     
+    __slots__ = ()
+    
     name = "wait_for_task"
     description = "Wait for user to provide a new task"
     
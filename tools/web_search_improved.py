@@ -1,19 +1,117 @@
 """Improved web search tool for Seeker agent using DuckDuckGo."""
-from typing import List, Dict
+import re
+from typing import List, Dict, Optional
+from urllib.parse import unquote
 
 # BaseTool import adjusted for direct execution
 try:
     from .base import BaseTool
+    from .web_tools import _get_session
+    from ._cache import TTLCache
 except ImportError:
     # For direct execution/testing
     class BaseTool:
         pass
 
+    def _get_session():
+        import requests
+        return requests
+
+    from _cache import TTLCache
+
+# Recent successful searches by (query, max_results)
+_SEARCH_CACHE = TTLCache(maxsize=256, ttl=300)
+
+# DuckDuckGo links go through //duckduckgo.com/l/?uddg=<escaped target>
+_UDDG = re.compile(r"[?&]uddg=([^&]+)")
+
+# bs4 SoupStrainer for result divs, built on first bs4 parse
+_RESULT_STRAINER = None
+
+# selectolax's lexbor parser class, None when it is not installed, _UNSET until first checked
+_UNSET = object()
+_HTML_PARSER = _UNSET
+
+
+def _import_html_parser():
+    """Return selectolax's LexborHTMLParser or None, trying the import only once."""
+    global _HTML_PARSER
+    if _HTML_PARSER is _UNSET:
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            LexborHTMLParser = None
+        _HTML_PARSER = LexborHTMLParser
+    return _HTML_PARSER
+
+
+def _clean_url(url: Optional[str]) -> Optional[str]:
+    """Unwrap a DuckDuckGo redirect link to the result's real URL."""
+    if url:
+        match = _UDDG.search(url)
+        if match:
+            return unquote(match.group(1))
+    return url
+
+
+def _has_result_class(value: Optional[str]) -> bool:
+    """True if a class attribute (one name or a space-separated list) includes "result"."""
+    return bool(value) and "result" in value.split()
+
+
+def _parse_results(html: str, max_results: int) -> List[Dict[str, str]]:
+    """
+    Extract title/url/snippet dicts from a DuckDuckGo HTML results page.
+
+    Uses selectolax's lexbor backend (a C parser) when it is installed and falls back to
+    BeautifulSoup's pure-Python html.parser otherwise.
+    """
+    HTMLParser = _import_html_parser()
+    
+    results = []
+    if HTMLParser is not None:
+        for node in HTMLParser(html).css("div.result")[:max_results]:
+            title_elem = node.css_first("a.result__a")
+            snippet_elem = node.css_first("a.result__snippet")
+            if title_elem and snippet_elem:
+                results.append({
+                    "title": title_elem.text(strip=True),
+                    "url": _clean_url(title_elem.attributes.get("href")),
+                    "snippet": snippet_elem.text(strip=True)
+                })
+        return results
+    
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    global _RESULT_STRAINER
+    if _RESULT_STRAINER is None:
+        # DDG result divs carry several classes ("result results_links ...");
+        # a plain 'result' string would not match them while straining
+        _RESULT_STRAINER = SoupStrainer('div', class_=_has_result_class)
+    
+    # Only result divs (and their subtrees) are built into the tree
+    soup = BeautifulSoup(html, 'html.parser', parse_only=_RESULT_STRAINER)
+    for result in soup.find_all('div', class_='result')[:max_results]:
+        title_elem = result.find('a', class_='result__a')
+        snippet_elem = result.find('a', class_='result__snippet')
+        
+        if title_elem and snippet_elem:
+            results.append({
+                "title": title_elem.get_text(strip=True),
+                "url": _clean_url(title_elem.get('href')),
+                "snippet": snippet_elem.get_text(strip=True)
+            })
+    return results
+
+
 class WebSearchImprovedTool(BaseTool):
     """Improved tool for web searching using DuckDuckGo."""
     
+    __slots__ = ()
+    
     name = "web_search_improved"
     description = "Perform a web search using DuckDuckGo and return results"
+    parallel_safe = True
     parameters = {
         "query": {
             "type": "string",
@@ -29,10 +127,13 @@ class WebSearchImprovedTool(BaseTool):
         """
         Perform web search using DuckDuckGo.
         """
+        key = (query, max_results)
+        cached = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            # Fresh dicts so callers cannot edit the cached entry
+            return [dict(r) for r in cached]
+        
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
             # Using DuckDuckGo's HTML search interface
             search_url = "https://html.duckduckgo.com/html/"
             params = {
@@ -40,38 +141,23 @@ class WebSearchImprovedTool(BaseTool):
                 "kl": "us-en"  # Set region to US English
             }
             
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.post(search_url, data=params, headers=headers, timeout=30)
+            # Shared keep-alive session; it already sends a browser User-Agent
+            response = _get_session().post(search_url, data=params, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            results = []
-            
-            # Parse search results
-            for result in soup.find_all('div', class_='result')[:max_results]:
-                title_elem = result.find('a', class_='result__a')
-                snippet_elem = result.find('a', class_='result__snippet')
-                
-                if title_elem and snippet_elem:
-                    title = title_elem.get_text(strip=True)
-                    url = title_elem.get('href')
-                    snippet = snippet_elem.get_text(strip=True)
-                    
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet
-                    })
+            results = _parse_results(response.text, max_results)
             
             if not results:
                 return [{"error": "No search results found"}]
-                
+            
+            _SEARCH_CACHE.set(key, tuple(dict(r) for r in results))
             return results
             
         except ImportError as e:
             return [{"error": f"Missing required library: {str(e)}. Please install with: pip install requests beautifulsoup4"}]
         except Exception as e:
-            return [{"error": f"Search failed: {str(e)}"}]
\ No newline at end of file
+            return [{"error": f"Search failed: {str(e)}"}]
+
+
+# Shared instance that WebSearchTool delegates to
+_IMPROVED = WebSearchImprovedTool()
@@ -1,38 +1,110 @@
 """Web-related tools for Seeker agent."""
+import threading
 from typing import List, Dict
 from .base import BaseTool
+from ._cache import TTLCache
+
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Default download cap for web_fetch
+_MAX_FETCH_BYTES = 5 * 1024 * 1024
+
+# Recent successful fetches by URL, as (max_bytes, text)
+_FETCH_CACHE = TTLCache(maxsize=256, ttl=300)
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Shared requests.Session so repeated fetches reuse TCP/TLS connections.
+
+    requests is imported on first use; ImportError propagates to the caller.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.headers.update(_DEFAULT_HEADERS)
+                adapter = HTTPAdapter(
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, backoff_factor=0.3),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
 
 
 class WebFetchTool(BaseTool):
     """Tool for fetching web content."""
     
+    __slots__ = ()
+    
     name = "web_fetch"
     description = "Fetch content from a URL"
+    parallel_safe = True
     parameters = {
         "url": {
             "type": "string",
             "description": "URL to fetch content from"
+        },
+        "max_bytes": {
+            "type": "integer",
+            "description": "Maximum number of bytes to download (default: 5 MiB)"
         }
     }
     
-    def execute(self, url: str) -> str:
-        """Fetch content from URL."""
+    def execute(self, url: str, max_bytes: int = _MAX_FETCH_BYTES) -> str:
+        """Fetch content from URL, downloading at most max_bytes."""
+        cached = _FETCH_CACHE.get(url)
+        if cached is not None and cached[0] == max_bytes:
+            return cached[1]
         try:
-            import requests
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            # Stream into one buffer and decode once; stop reading at the cap
+            with _get_session().get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                buf = bytearray()
+                truncated = False
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf += chunk
+                    # Read past the cap before flagging, so a body of exactly
+                    # max_bytes is not reported as truncated
+                    if len(buf) > max_bytes:
+                        truncated = True
+                        del buf[max_bytes:]
+                        break
+                text = buf.decode(response.encoding or "utf-8", errors="replace")
+            if truncated:
+                text += f"\n\n[Content truncated at {max_bytes} bytes]"
+            _FETCH_CACHE.set(url, (max_bytes, text))
+            return text
         except ImportError:
             return "Error: requests library not installed. Install with: pip install requests"
         except Exception as e:
             return f"Error fetching {url}: {e}"
+    
+    def invalidate(self, url: str):
+        """Forget a cached fetch so the next call hits the network."""
+        _FETCH_CACHE.invalidate(url)
 
 
 class WebSearchTool(BaseTool):
     """Tool for web searching."""
     
+    __slots__ = ()
+    
     name = "web_search"
     description = "Perform a web search and return results"
+    parallel_safe = True
     parameters = {
         "query": {
             "type": "string",
@@ -48,13 +120,8 @@ class WebSearchTool(BaseTool):
         """
         Perform web search.
         
-        Note: This is a placeholder implementation.
-        In production, integrate with a search API like Google Custom Search.
+        Delegates to the DuckDuckGo-backed web_search_improved tool so both
+        names share one code path and one result cache.
         """
-        return [
-            {
-                "title": f"Search result for '{query}'",
-                "url": "https://example.com",
-                "snippet": "This is a placeholder search result. Integrate with a real search API for production use."
-            }
-        ]
+        from .web_search_improved import _IMPROVED
+        return _IMPROVED.execute(query, max_results)